@@ -1,26 +1,26 @@
-"""
-Controllers Package
-Business logic controllers for Work Log application
-"""
-
-from .login_controller import LoginController
-from .attendance_controller import AttendanceController
-from .admin_dashboard_controller import AdminDashboardController
-from .employee_controller import EmployeeController
-from .reports_controller import ReportsController
-from .shift_controller import ShiftController
-from .leave_controller import LeaveController
-from .overtime_controller import OvertimeController
-from .user_controller import UserController
-
-__all__ = [
-    'LoginController',
-    'AttendanceController',
-    'AdminDashboardController',
-    'EmployeeController',
-    'ReportsController',
-    'ShiftController',
-    'LeaveController',
-    'OvertimeController',
-    'UserController',
-]
+"""
+Controllers Package
+Business logic controllers for Work Log application
+"""
+
+from .login_controller import LoginController
+from .attendance_controller import AttendanceController
+from .admin_dashboard_controller import AdminDashboardController
+from .employee_controller import EmployeeController
+from .reports_controller import ReportsController
+from .shift_controller import ShiftController
+from .leave_controller import LeaveController
+from .overtime_controller import OvertimeController
+from .user_controller import UserController
+
+__all__ = [
+    'LoginController',
+    'AttendanceController',
+    'AdminDashboardController',
+    'EmployeeController',
+    'ReportsController',
+    'ShiftController',
+    'LeaveController',
+    'OvertimeController',
+    'UserController',
+]
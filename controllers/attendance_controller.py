@@ -5,23 +5,90 @@ All DB operations via Database singleton using model SQL constants.
 Zero UI imports. Returns result tuples for the view to display.
 """
 
+import threading
+import weakref
 from datetime import datetime, date, timedelta, time as time_type
 from models.database import db
 from models.attendance_model import AttendanceModel
 from models.shift_model import ShiftModel
 
+DEFAULT_SHIFT_START = time_type(8, 0, 0)
+STANDARD_HOURS = AttendanceModel.STANDARD_WORKING_HOURS
+
+# Resolved (normalized) shift per employee for the process lifetime; cleared
+# whenever a shift or an employee's shift assignment changes.
+_SHIFT_CACHE = {}
+_SHIFT_CACHE_LOCK = threading.Lock()
+# Other controllers' shift caches, cleared alongside _SHIFT_CACHE
+_SHIFT_CACHE_LISTENERS = []
+
+# Live controller per employee, so warm per-instance caches survive across views
+_INSTANCES = weakref.WeakValueDictionary()
+_INSTANCES_LOCK = threading.Lock()
+
+
+def _clear_report_cache():
+    """Invalidate cached reports; imported here since reports_controller imports this module"""
+    from controllers.reports_controller import ReportsController
+    ReportsController.clear_report_cache()
+
 
 class AttendanceController:
     """Controller for attendance operations  pure transaction, zero UI"""
 
+    STATUS_FLAGS = AttendanceModel.STATUS_FLAGS
+
     def __init__(self, employee_id):
         self.employee_id = employee_id
         self.db = db
+        self._today = None
+        self._today_record = None
+
+    @classmethod
+    def for_employee(cls, employee_id):
+        """Return the shared controller for an employee, creating it on first use"""
+        with _INSTANCES_LOCK:
+            controller = _INSTANCES.get(employee_id)
+            if controller is None:
+                controller = cls(employee_id)
+                _INSTANCES[employee_id] = controller
+            return controller
 
     #  Read Operations 
     def get_today_record(self):
-        return self.db.fetch_one(AttendanceModel.Q_GET_TODAY,
-                                 (self.employee_id, date.today()))
+        """Today's attendance row, cached until a write or the date rolls over"""
+        today = date.today()
+        if self._today_record is None or self._today != today:
+            self._today = today
+            self._today_record = self.db.fetch_one_prepared(AttendanceModel.Q_GET_TODAY,
+                                                            (self.employee_id, today))
+        return self._today_record
+
+    def _merge_today(self, success, **fields):
+        """Apply a successful write to the cached today row instead of re-reading it"""
+        if success and self._today_record is not None and self._today == date.today():
+            self._today_record = {**self._today_record, **fields}
+        else:
+            self._today_record = None
+
+    def _guarded_update(self, query, params):
+        """
+        Run one of the IS NULL-guarded today-row UPDATEs.
+        Returns True if it wrote, False if the row had already moved on
+        (the cached row is dropped so the next read is fresh), None on error.
+        """
+        changed = self.db.execute_rowcount(query, params)
+        if changed is None:
+            return None
+        if changed == 0:
+            self._today_record = None
+            return False
+        return True
+
+    @staticmethod
+    def _time_column(moment):
+        """A datetime's time of day in the shape MySQL returns TIME columns (timedelta)"""
+        return timedelta(hours=moment.hour, minutes=moment.minute, seconds=moment.second)
 
     def get_today_attendance(self):
         return self.get_today_record()
@@ -35,14 +102,30 @@ class AttendanceController:
 
     #  Shift Helper 
     def _get_employee_shift(self):
-        shift = self.db.fetch_one(ShiftModel.Q_SELECT_EMPLOYEE_SHIFT,
-                                  (self.employee_id,))
-        if not shift:
-            shift = self.db.fetch_one(ShiftModel.Q_SELECT_DEFAULT)
-        if not shift:
-            shift = self.db.fetch_one(ShiftModel.Q_SELECT_FIRST_ACTIVE)
+        with _SHIFT_CACHE_LOCK:
+            if self.employee_id in _SHIFT_CACHE:
+                return _SHIFT_CACHE[self.employee_id]
+        shift = self.db.fetch_one_prepared(ShiftModel.Q_SELECT_EMPLOYEE_SHIFT_OR_FALLBACK,
+                                           (self.employee_id,))
+        shift = AttendanceController._normalize_shift(shift)
+        if shift:
+            with _SHIFT_CACHE_LOCK:
+                _SHIFT_CACHE[self.employee_id] = shift
         return shift
 
+    @staticmethod
+    def clear_shift_cache():
+        """Drop every cached employee shift (call after any shift or assignment change)"""
+        with _SHIFT_CACHE_LOCK:
+            _SHIFT_CACHE.clear()
+        for listener in _SHIFT_CACHE_LISTENERS:
+            listener()
+
+    @staticmethod
+    def add_shift_cache_listener(listener):
+        """Call listener() whenever clear_shift_cache() runs"""
+        _SHIFT_CACHE_LISTENERS.append(listener)
+
     #  Check-In 
     def can_check_in(self):
         """
@@ -60,47 +143,18 @@ class AttendanceController:
 
         # Validate check-in is within shift schedule
         shift = self._get_employee_shift()
-        if shift:
+        if shift and 'end_s' in shift:
             now = datetime.now()
-            shift_end = shift.get('end_time')
-            shift_start = shift.get('start_time')
-            shift_name = shift.get('shift_name', 'your shift')
-
-            def to_time(val):
-                if isinstance(val, timedelta):
-                    total_seconds = int(val.total_seconds())
-                    h = total_seconds // 3600
-                    m = (total_seconds % 3600) // 60
-                    s = total_seconds % 60
-                    return time_type(h, m, s)
-                elif isinstance(val, str):
-                    return datetime.strptime(val, '%H:%M:%S').time()
-                return val
-
-            try:
-                end_t = to_time(shift_end)
-                start_t = to_time(shift_start)
-                current_t = now.time()
-
-                # Determine if the employee is outside their shift window
-                outside = False
-                if start_t < end_t:
-                    # Day shift (e.g. 8 AM – 5 PM): block after end
-                    outside = current_t > end_t
-                else:
-                    # Night shift (e.g. 10 PM – 7 AM): block in the gap
-                    # Gap is between end_t and start_t (e.g. 7 AM – 10 PM)
-                    outside = end_t < current_t < start_t
-
-                if outside:
-                    end_fmt = datetime.combine(date.today(), end_t).strftime('%I:%M %p')
-                    start_fmt = datetime.combine(date.today(), start_t).strftime('%I:%M %p')
-                    return (False, "Outside Shift Schedule",
-                            f"Your shift ({shift_name}) is {start_fmt} - {end_fmt}.\n"
-                            f"Check-in is not allowed after your shift has ended.",
-                            "warning")
-            except (ValueError, TypeError):
-                pass  # If shift time parsing fails, allow check-in
+            now_s = now.hour * 3600 + now.minute * 60 + now.second
+            # Blocked between shift end and the next start (day shifts: until midnight)
+            if shift['end_s'] < now_s < shift['block_until_s']:
+                shift_name = shift.get('shift_name', 'your shift')
+                end_fmt = shift['end_time'].strftime('%I:%M %p')
+                start_fmt = shift['start_time'].strftime('%I:%M %p')
+                return (False, "Outside Shift Schedule",
+                        f"Your shift ({shift_name}) is {start_fmt} - {end_fmt}.\n"
+                        f"Check-in is not allowed after your shift has ended.",
+                        "warning")
 
         return (True, "", "", "")
 
@@ -109,11 +163,18 @@ class AttendanceController:
         Execute check-in. Call can_check_in() first for validation.
         Returns (success, title, message, msg_type)
         """
-        now = datetime.now()
-        params = (self.employee_id, now.strftime('%Y-%m-%d'), now.strftime('%H:%M:%S'))
-        success = self.db.execute_query(AttendanceModel.Q_CHECK_IN, params)
+        now = datetime.now().replace(microsecond=0)
+        params = (self.employee_id, now.date(), now.time())
+        success = self.db.execute_prepared(AttendanceModel.Q_CHECK_IN, params)
+        self._today = now.date()
+        self._today_record = {
+            'employee_id': self.employee_id, 'date': now.date(),
+            'time_in': self._time_column(now), 'lunch_start': None, 'lunch_end': None,
+            'time_out': None, 'status': 'Incomplete'
+        } if success else None
 
         if success:
+            _clear_report_cache()
             current_time = now.strftime('%I:%M %p')
             return (True, "Check In Successful",
                     f"Checked in at {current_time}", "info")
@@ -121,12 +182,13 @@ class AttendanceController:
                 "Failed to record check-in. Please try again.", "error")
 
     #  Lunch 
-    def can_start_lunch(self):
+    def can_start_lunch(self, record=None):
         """
         Check if employee can start lunch based on shift rules.
+        Pass a pre-fetched today record to skip the lookup.
         Returns (can, title, message, msg_type)
         """
-        today_record = self.get_today_record()
+        today_record = record if record is not None else self.get_today_record()
         if not today_record:
             return (False, "Not Checked In", "Please check in first.", "warning")
         if today_record.get('lunch_start'):
@@ -135,21 +197,14 @@ class AttendanceController:
             return (False, "Already Checked Out", "Already checked out.", "warning")
 
         shift = self._get_employee_shift()
-        min_hours = float(shift.get('min_hours_before_lunch') or 3) if shift else 3.0
+        min_hours = shift['min_hours_before_lunch'] if shift else 3.0
 
         time_in = today_record.get('time_in')
         if time_in:
-            today_date = date.today()
-            if isinstance(time_in, timedelta):
-                total_seconds = int(time_in.total_seconds())
-                hours = total_seconds // 3600
-                minutes = (total_seconds % 3600) // 60
-                seconds = total_seconds % 60
-                dt_in = datetime.combine(today_date, time_type(hours, minutes, seconds))
-            elif isinstance(time_in, datetime):
+            if isinstance(time_in, datetime):
                 dt_in = time_in
             else:
-                dt_in = datetime.combine(today_date, time_in)
+                dt_in = datetime.combine(date.today(), AttendanceController._to_time(time_in))
 
             earliest_lunch = dt_in + timedelta(hours=min_hours)
             now = datetime.now()
@@ -168,22 +223,28 @@ class AttendanceController:
         Record lunch start. Call can_start_lunch() first for validation.
         Returns (success, title, message, msg_type)
         """
-        now = datetime.now()
-        params = (now.strftime('%H:%M:%S'), self.employee_id, now.strftime('%Y-%m-%d'))
-        success = self.db.execute_query(AttendanceModel.Q_START_LUNCH, params)
+        now = datetime.now().replace(microsecond=0)
+        params = (now.time(), self.employee_id, now.date())
+        success = self._guarded_update(AttendanceModel.Q_START_LUNCH, params)
+        if success is False:
+            return (False, "Lunch Already Started",
+                    "Lunch start is already recorded for today.", "warning")
+        self._merge_today(success, lunch_start=self._time_column(now))
 
         if success:
+            _clear_report_cache()
             return (True, "Lunch Started",
                     f"Lunch break started at {now.strftime('%I:%M %p')}", "info")
         return (False, "Failed",
                 "Failed to record lunch start. Please try again.", "error")
 
-    def can_end_lunch(self):
+    def can_end_lunch(self, record=None):
         """
         Validate if lunch end is possible.
+        Pass a pre-fetched today record to skip the lookup.
         Returns (can, title, message, msg_type)
         """
-        today_record = self.get_today_record()
+        today_record = record if record is not None else self.get_today_record()
         if not today_record:
             return (False, "Not Checked In", "Please check in first.", "warning")
         if not today_record.get('lunch_start'):
@@ -199,23 +260,29 @@ class AttendanceController:
         Record lunch end. Call can_end_lunch() first for validation.
         Returns (success, title, message, msg_type)
         """
-        now = datetime.now()
-        params = (now.strftime('%H:%M:%S'), self.employee_id, now.strftime('%Y-%m-%d'))
-        success = self.db.execute_query(AttendanceModel.Q_END_LUNCH, params)
+        now = datetime.now().replace(microsecond=0)
+        params = (now.time(), self.employee_id, now.date())
+        success = self._guarded_update(AttendanceModel.Q_END_LUNCH, params)
+        if success is False:
+            return (False, "Lunch Already Ended",
+                    "Lunch end is already recorded for today.", "warning")
+        self._merge_today(success, lunch_end=self._time_column(now))
 
         if success:
+            _clear_report_cache()
             return (True, "Lunch Ended",
                     f"Lunch break ended at {now.strftime('%I:%M %p')}", "info")
         return (False, "Failed",
                 "Failed to record lunch end. Please try again.", "error")
 
     #  Check-Out 
-    def can_check_out(self):
+    def can_check_out(self, record=None):
         """
         Validate if check-out is possible.
+        Pass a pre-fetched today record to skip the lookup.
         Returns (can, title, message, msg_type)
         """
-        today_record = self.get_today_record()
+        today_record = record if record is not None else self.get_today_record()
         if not today_record:
             return (False, "Not Checked In",
                     "You have not checked in today.", "warning")
@@ -224,12 +291,14 @@ class AttendanceController:
                     "You have already checked out today.", "warning")
         return (True, "", "", "")
 
-    def check_out(self):
+    def check_out(self, record=None):
         """
         Execute check-out with time calculations.
+        The record passed to can_check_out() (or the cached row) only screens
+        the request; hours and status come from the row as stored.
         Returns (success, title, message, msg_type)
         """
-        today_record = self.get_today_record()
+        today_record = record if record is not None else self.get_today_record()
         if not today_record:
             return (False, "Not Checked In",
                     "You have not checked in today.", "warning")
@@ -237,36 +306,61 @@ class AttendanceController:
             return (False, "Already Checked Out",
                     "You have already checked out today.", "warning")
 
-        now = datetime.now()
+        now = datetime.now().replace(microsecond=0)
+        shift = self._get_employee_shift()
+        with self.db.transaction():
+            today_record = self.db.fetch_one_prepared(AttendanceModel.Q_GET_TODAY_FOR_UPDATE,
+                                                      (self.employee_id, now.date()))
+            self._today = now.date()
+            self._today_record = today_record
+            if not today_record:
+                return (False, "Not Checked In",
+                        "You have not checked in today.", "warning")
+            if today_record.get('time_out'):
+                return (False, "Already Checked Out",
+                        "You have already checked out today.", "warning")
+            return self._record_check_out(today_record, now, shift)
+
+    def _record_check_out(self, today_record, now, shift):
+        """Compute hours/status from the freshly read row and write the check-out"""
         time_in = today_record.get('time_in')
         lunch_start = today_record.get('lunch_start')
         lunch_end = today_record.get('lunch_end')
 
         # compute paid hours
         result = AttendanceController.compute_paid_hours(
-            time_in, now.strftime('%H:%M:%S'), lunch_start, lunch_end
+            time_in, now, lunch_start, lunch_end
         )
-        total_time = result['total_time']
-        lunch_duration = result['lunch_duration']
-        paid_hours = result['paid_hours']
+        # Round once here; the DECIMAL(5,2) columns and the message show 2 places
+        total_time = round(result['total_time'], 2)
+        lunch_duration = round(result['lunch_duration'], 2)
+        paid_hours = round(result['paid_hours'], 2)
 
         # Determine overtime
-        overtime_hours = max(0, round(paid_hours - AttendanceModel.STANDARD_WORKING_HOURS, 2))
+        overtime_hours = round(max(0.0, paid_hours - STANDARD_HOURS), 2)
 
         # Determine status
-        shift = self._get_employee_shift()
-        shift_start = shift.get('start_time', '08:00:00') if shift else '08:00:00'
-        grace_period = int(shift.get('grace_period_mins') or 15) if shift else 15
+        shift_start = shift.get('start_time') or DEFAULT_SHIFT_START if shift else DEFAULT_SHIFT_START
+        grace_period = shift['grace_period_mins'] if shift else 15
         status = AttendanceController.determine_status(time_in, paid_hours, shift_start, grace_period)
+        status_code = AttendanceController.status_code(status)
 
         params = (
-            now.strftime('%H:%M:%S'), total_time, lunch_duration,
-            paid_hours, overtime_hours, status,
-            self.employee_id, now.strftime('%Y-%m-%d')
+            now.time(), total_time, lunch_duration,
+            paid_hours, overtime_hours, status, status_code,
+            self.employee_id, now.date()
         )
-        success = self.db.execute_query(AttendanceModel.Q_CHECK_OUT, params)
+        success = self._guarded_update(AttendanceModel.Q_CHECK_OUT, params)
+        if success is False:
+            return (False, "Already Checked Out",
+                    "You have already checked out today.", "warning")
+        self._merge_today(success, time_out=self._time_column(now), total_time=total_time,
+                          lunch_duration=lunch_duration, paid_hours=paid_hours,
+                          overtime_hours=overtime_hours, status=status,
+                          status_code=status_code)
 
         if success:
+            _clear_report_cache()
             current_time = now.strftime('%I:%M %p')
             return (True, "Check Out Successful",
                     f"Checked out at {current_time}\n"
@@ -276,6 +370,39 @@ class AttendanceController:
                 "Failed to record check-out. Please try again.", "error")
 
     # ── Pure Computation Methods ──
+    @staticmethod
+    def _to_time(value):
+        """Coerce a TIME column value (timedelta, str or time) to datetime.time"""
+        if isinstance(value, timedelta):
+            total_seconds = int(value.total_seconds())
+            return time_type(total_seconds // 3600, (total_seconds % 3600) // 60, total_seconds % 60)
+        if isinstance(value, datetime):
+            return value.time()
+        if isinstance(value, str):
+            return datetime.strptime(value, '%H:%M:%S').time()
+        return value
+
+    @staticmethod
+    def _normalize_shift(shift):
+        """Convert a shift row's times and limits to native types once, at fetch time"""
+        if not shift:
+            return shift
+        shift = dict(shift)
+        for key in ('start_time', 'end_time'):
+            if shift.get(key) is not None:
+                shift[key] = AttendanceController._to_time(shift[key])
+        start_t, end_t = shift.get('start_time'), shift.get('end_time')
+        if isinstance(start_t, time_type) and isinstance(end_t, time_type):
+            start_s = start_t.hour * 3600 + start_t.minute * 60 + start_t.second
+            end_s = end_t.hour * 3600 + end_t.minute * 60 + end_t.second
+            # Day shift (start < end): check-in closes from end until midnight.
+            # Night shift (e.g. 10 PM - 7 AM): closed in the gap from end until start.
+            shift['end_s'] = end_s
+            shift['block_until_s'] = 86400 if start_s < end_s else start_s
+        shift['grace_period_mins'] = int(shift.get('grace_period_mins') or 15)
+        shift['min_hours_before_lunch'] = float(shift.get('min_hours_before_lunch') or 3)
+        return shift
+
     @staticmethod
     def compute_paid_hours(time_in, time_out, lunch_start, lunch_end):
         """
@@ -286,7 +413,7 @@ class AttendanceController:
         - Only lunch break (1 hour) is UNPAID (deducted)
 
         Returns:
-            Dictionary with total_time, lunch_duration, and paid_hours in hours
+            Dictionary with unrounded total_time, lunch_duration, and paid_hours in hours
         """
         today = date.today()
 
@@ -295,18 +422,7 @@ class AttendanceController:
                 return None
             if isinstance(value, datetime):
                 return value
-            if isinstance(value, str):
-                t = datetime.strptime(value, '%H:%M:%S').time()
-                return datetime.combine(today, t)
-            if isinstance(value, timedelta):
-                total_seconds = int(value.total_seconds())
-                hours = total_seconds // 3600
-                minutes = (total_seconds % 3600) // 60
-                seconds = total_seconds % 60
-                t = time_type(hours, minutes, seconds)
-                return datetime.combine(today, t)
-            else:
-                return datetime.combine(today, value)
+            return datetime.combine(today, AttendanceController._to_time(value))
 
         dt_in = to_datetime(time_in)
         dt_out = to_datetime(time_out)
@@ -314,26 +430,20 @@ class AttendanceController:
         if dt_in is None or dt_out is None:
             return {'total_time': 0, 'lunch_duration': 0, 'paid_hours': 0}
 
-        total_time_delta = dt_out - dt_in
-        total_hours = total_time_delta.total_seconds() / 3600
+        total_seconds = (dt_out - dt_in).total_seconds()
 
-        lunch_hours = 0
+        lunch_seconds = 0
         if lunch_start and lunch_end:
-            dt_lunch_start = to_datetime(lunch_start)
-            dt_lunch_end = to_datetime(lunch_end)
-            lunch_delta = dt_lunch_end - dt_lunch_start
-            lunch_hours = lunch_delta.total_seconds() / 3600
-
-        paid_hours = total_hours - lunch_hours
+            lunch_seconds = (to_datetime(lunch_end) - to_datetime(lunch_start)).total_seconds()
 
         return {
-            'total_time': round(total_hours, 2),
-            'lunch_duration': round(lunch_hours, 2),
-            'paid_hours': round(paid_hours, 2)
+            'total_time': total_seconds / 3600,
+            'lunch_duration': lunch_seconds / 3600,
+            'paid_hours': (total_seconds - lunch_seconds) / 3600
         }
 
     @staticmethod
-    def determine_status(time_in, paid_hours, shift_start_time='08:00:00', grace_period_mins=15):
+    def determine_status(time_in, paid_hours, shift_start_time=DEFAULT_SHIFT_START, grace_period_mins=15):
         """
         Determine attendance status.
 
@@ -342,27 +452,8 @@ class AttendanceController:
         """
         status = []
 
-        if isinstance(time_in, datetime):
-            check_in_time = time_in.time()
-        elif isinstance(time_in, timedelta):
-            total_seconds = int(time_in.total_seconds())
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-            seconds = total_seconds % 60
-            check_in_time = time_type(hours, minutes, seconds)
-        else:
-            check_in_time = time_in
-
-        if isinstance(shift_start_time, timedelta):
-            total_seconds = int(shift_start_time.total_seconds())
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-            seconds = total_seconds % 60
-            shift_start = time_type(hours, minutes, seconds)
-        elif isinstance(shift_start_time, str):
-            shift_start = datetime.strptime(shift_start_time, '%H:%M:%S').time()
-        else:
-            shift_start = shift_start_time
+        check_in_time = AttendanceController._to_time(time_in)
+        shift_start = AttendanceController._to_time(shift_start_time)
 
         shift_start_dt = datetime.combine(date.today(), shift_start)
         grace_end_dt = shift_start_dt + timedelta(minutes=int(grace_period_mins))
@@ -373,9 +464,26 @@ class AttendanceController:
         else:
             status.append("On Time")
 
-        if paid_hours >= AttendanceModel.STANDARD_WORKING_HOURS:
+        if paid_hours >= STANDARD_HOURS:
             status.append("Complete")
         else:
             status.append("Undertime")
 
         return ", ".join(status)
+
+    @staticmethod
+    def status_code(status):
+        """Bit flags for a status string (see AttendanceModel.STATUS_FLAGS); 0 for Incomplete"""
+        flags = AttendanceModel.STATUS_FLAGS
+        return sum(flags.get(part, 0) for part in status.split(', ')) if status else 0
+
+    @staticmethod
+    def weekly_chart_series(summary):
+        """Transpose Q_WEEKLY_SUMMARY rows into (labels, on_time, late) chart columns"""
+        if not summary:
+            return [], [], []
+        labels, on_time, late = zip(*(
+            (row['date'].strftime('%a\n%m/%d') if hasattr(row['date'], 'strftime') else str(row['date']),
+             row['on_time_count'], row['late_count'])
+            for row in summary))
+        return list(labels), list(on_time), list(late)
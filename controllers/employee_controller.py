@@ -1,217 +1,225 @@
-"""
-Employee Controller (MVC)
-Handles all employee management business logic and database operations.
-"""
-
-import re
-from models.database import db
-from models.employee_model import EmployeeModel
-from models.user_model import UserModel
-
-
-class EmployeeController:
-    """Controller for employee management"""
-
-    def __init__(self):
-        self.db = db
-
-    # ── Validation (pure logic, no DB) ──
-    @staticmethod
-    def validate_ph_phone(phone):
-        if not phone:
-            return True
-        cleaned = re.sub(r'[\s\-()]+', '', phone)
-        return bool(re.match(r'^(09\d{9}|\+?639\d{9})$', cleaned))
-
-    @staticmethod
-    def validate_email(email):
-        if not email:
-            return True
-        return bool(re.match(r'^[^@\s]+@[^@\s]+\.[^@\s]+$', email))
-
-    # ── Read Operations ──
-    def get_all_employees(self):
-        return self.db.fetch_all(EmployeeModel.Q_SELECT_ALL)
-
-    def get_all_employees_with_shifts(self):
-        return self.db.fetch_all(EmployeeModel.Q_SELECT_WITH_SHIFTS)
-
-    def get_employee_by_id(self, employee_id):
-        return self.db.fetch_one(EmployeeModel.Q_SELECT_BY_ID, (employee_id,))
-
-    def get_employee_by_code(self, code):
-        return self.db.fetch_one(EmployeeModel.Q_SELECT_BY_CODE, (code,))
-
-    def get_active_employees(self):
-        return self.db.fetch_all(EmployeeModel.Q_SELECT_ACTIVE)
-
-    def get_non_admin_employees(self):
-        return self.db.fetch_all(EmployeeModel.Q_SELECT_NON_ADMIN)
-
-    def get_employee_count(self):
-        result = self.db.fetch_one(EmployeeModel.Q_COUNT)
-        return result['cnt'] if result else 0
-
-    # ── Code Generation ──
-    def generate_employee_code(self):
-        result = self.db.fetch_one(EmployeeModel.Q_LAST_CODE)
-        if result and result.get('employee_code'):
-            last_code = result['employee_code']
-            try:
-                num = int(last_code.replace('EMP', '')) + 1
-            except ValueError:
-                num = 1
-        else:
-            num = 1
-        return f"EMP{num:03d}"
-
-    # ── Create ──
-    def add_employee(self, employee_data):
-        """
-        Validate and insert a new employee.
-        Returns (employee_id, None) on success, (None, error_message) on failure.
-        """
-        required_fields = ['full_name', 'position', 'department']
-        for field in required_fields:
-            if not employee_data.get(field):
-                return None, f"Please enter {field.replace('_', ' ').title()}"
-
-        email = employee_data.get('email', '').strip()
-        if email and not self.validate_email(email):
-            return None, "Please enter a valid email address (e.g., name@example.com)."
-
-        phone = employee_data.get('phone', '').strip()
-        if phone and not self.validate_ph_phone(phone):
-            return None, ("Please enter a valid Philippine phone number.\n\n"
-                          "Accepted formats:\n    09XXXXXXXXX\n    +639XXXXXXXXX\n    639XXXXXXXXX")
-
-        employee_code = self.generate_employee_code()
-        params = (
-            employee_code,
-            employee_data['full_name'],
-            employee_data['position'],
-            employee_data['department'],
-            employee_data.get('email', ''),
-            employee_data.get('phone', ''),
-            employee_data.get('leave_credits', 15),
-            employee_data.get('shift_id')
-        )
-
-        if self.db.execute_query(EmployeeModel.Q_INSERT, params):
-            return self.db.get_last_insert_id(), None
-        return None, "Failed to add employee. Please try again."
-
-    # ── Update ──
-    def update_employee(self, employee_id, employee_data):
-        """
-        Validate and update an employee record.
-        Returns (True, None) on success, (False, error_message) on failure.
-        """
-        required_fields = ['full_name', 'position', 'department']
-        for field in required_fields:
-            if not employee_data.get(field):
-                return False, f"Please enter {field.replace('_', ' ').title()}"
-
-        email = employee_data.get('email', '').strip()
-        if email and not self.validate_email(email):
-            return False, "Please enter a valid email address (e.g., name@example.com)."
-
-        phone = employee_data.get('phone', '').strip()
-        if phone and not self.validate_ph_phone(phone):
-            return False, ("Please enter a valid Philippine phone number.\n\n"
-                           "Accepted formats:\n    09XXXXXXXXX\n    +639XXXXXXXXX\n    639XXXXXXXXX")
-
-        shift_id = employee_data.get('shift_id')
-        if shift_id is not None:
-            params = (
-                employee_data['full_name'],
-                employee_data['position'],
-                employee_data['department'],
-                employee_data.get('email', ''),
-                employee_data.get('phone', ''),
-                shift_id,
-                employee_id
-            )
-            success = self.db.execute_query(EmployeeModel.Q_UPDATE_WITH_SHIFT, params)
-        else:
-            params = (
-                employee_data['full_name'],
-                employee_data['position'],
-                employee_data['department'],
-                employee_data.get('email', ''),
-                employee_data.get('phone', ''),
-                employee_id
-            )
-            success = self.db.execute_query(EmployeeModel.Q_UPDATE, params)
-
-        if success:
-            return True, None
-        return False, "Failed to update employee. Please try again."
-
-    # ── Delete / Deactivate ──
-    def deactivate_employee(self, employee_id):
-        """Deactivate an employee. Returns True/False."""
-        return bool(self.db.execute_query(EmployeeModel.Q_DEACTIVATE, (employee_id,)))
-
-    def delete_employee(self, employee_id):
-        """Permanently delete employee and all cascade-related records. Returns True/False."""
-        try:
-            self.db.execute_query(EmployeeModel.Q_CLEAR_OT_REVIEWED, (employee_id,))
-            user_row = self.db.fetch_one(EmployeeModel.Q_SELECT_USER_ID, (employee_id,))
-            if user_row:
-                self.db.execute_query(EmployeeModel.Q_CLEAR_LEAVE_REVIEWED, (user_row['id'],))
-            self.db.execute_query(EmployeeModel.Q_DELETE_OT, (employee_id,))
-            self.db.execute_query(EmployeeModel.Q_DELETE_LEAVE, (employee_id,))
-            self.db.execute_query(EmployeeModel.Q_DELETE_ATTENDANCE, (employee_id,))
-            self.db.execute_query(EmployeeModel.Q_DELETE_USER, (employee_id,))
-            return bool(self.db.execute_query(EmployeeModel.Q_DELETE, (employee_id,)))
-        except Exception as e:
-            print(f"Error deleting employee: {e}")
-            return False
-
-    # ── Leave Credits ──
-    def update_leave_credits(self, employee_id, leave_credits):
-        """
-        Update leave credits for an employee.
-        Returns (True, None) on success, (False, error_message) on failure.
-        """
-        if leave_credits < 0:
-            return False, "Leave credits cannot be negative."
-        success = self.db.execute_query(EmployeeModel.Q_UPDATE_LEAVE_CREDITS,
-                                        (leave_credits, employee_id))
-        if success:
-            return True, None
-        return False, "Failed to update leave credits. Please try again."
-
-    # ── User Account Operations (delegates to UserModel SQL) ──
-    def get_user_by_username(self, username):
-        return self.db.fetch_one(UserModel.Q_SELECT_BY_USERNAME, (username,))
-
-    def get_user_by_employee_id(self, employee_id):
-        return self.db.fetch_one(UserModel.Q_SELECT_BY_EMPLOYEE_ID, (employee_id,))
-
-    def get_user_by_id(self, user_id):
-        return self.db.fetch_one(UserModel.Q_SELECT_BY_ID, (user_id,))
-
-    def create_user(self, employee_id, username, password, role):
-        password_hash = UserModel.hash_password(password)
-        params = (employee_id, username, password_hash, role)
-        if self.db.execute_query(UserModel.Q_INSERT, params):
-            return self.db.get_last_insert_id()
-        return None
-
-    def change_password(self, user_id, old_password, new_password):
-        user = self.db.fetch_one(UserModel.Q_SELECT_BY_ID, (user_id,))
-        if not user:
-            return False, "User not found."
-        old_hash = UserModel.hash_password(old_password)
-        if user['password_hash'] != old_hash:
-            return False, "Current password is incorrect."
-        new_hash = UserModel.hash_password(new_password)
-        if self.db.execute_query(UserModel.Q_UPDATE_PASSWORD, (new_hash, user_id)):
-            return True, "Password changed successfully."
-        return False, "Failed to update password."
-
-    def update_password(self, user_id, new_password):
-        new_hash = UserModel.hash_password(new_password)
-        return self.db.execute_query(UserModel.Q_UPDATE_PASSWORD, (new_hash, user_id))
+"""
+Employee Controller (MVC)
+Handles all employee management business logic and database operations.
+"""
+
+try:
+    import re2 as re  # optional: linear-time matching, no backtracking
+except ImportError:
+    import re
+
+from models.database import db
+from models.employee_model import EmployeeModel
+from models.shift_model import ShiftModel
+from controllers.attendance_controller import AttendanceController
+from controllers.login_controller import LoginController
+from controllers.user_controller import UserController
+from controllers.staff_dashboard_controller import StaffDashboardController
+from utils.ttl_cache import ttl_cache
+
+_PH_CLEAN_RE = re.compile(r'[\s\-()]+')
+_PH_PHONE_RE = re.compile(r'^(09\d{9}|\+?639\d{9})$')
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+
+class EmployeeController:
+    """Controller for employee management"""
+
+    def __init__(self):
+        self.db = db
+        self.users = UserController()
+
+    # ── Validation (pure logic, no DB) ──
+    @staticmethod
+    def validate_ph_phone(phone):
+        if not phone:
+            return True
+        cleaned = _PH_CLEAN_RE.sub('', phone)
+        # 09XXXXXXXXX / 639XXXXXXXXX / +639XXXXXXXXX are 11-13 chars
+        if not 11 <= len(cleaned) <= 13 or cleaned[0] not in '0+6':
+            return False
+        return bool(_PH_PHONE_RE.match(cleaned))
+
+    @staticmethod
+    def validate_email(email):
+        if not email:
+            return True
+        if '@' not in email or '.' not in email or len(email) > 254:
+            return False
+        return bool(_EMAIL_RE.match(email))
+
+    # ── Read Operations ──
+    def get_all_employees(self):
+        return self.db.fetch_all_cached(EmployeeModel.Q_SELECT_ALL, tables=(EmployeeModel.TABLE,))
+
+    def get_all_employees_with_shifts(self):
+        return self.db.fetch_all_cached(EmployeeModel.Q_SELECT_WITH_SHIFTS,
+                                        tables=(EmployeeModel.TABLE, ShiftModel.TABLE))
+
+    def get_employee_by_id(self, employee_id):
+        return self.db.fetch_one_prepared(EmployeeModel.Q_SELECT_BY_ID, (employee_id,))
+
+    def get_employee_by_code(self, code):
+        return self.db.fetch_one(EmployeeModel.Q_SELECT_BY_CODE, (code,))
+
+    def get_active_employees(self):
+        return self.db.fetch_all(EmployeeModel.Q_SELECT_ACTIVE)
+
+    def get_non_admin_employees(self):
+        return self.db.fetch_all(EmployeeModel.Q_SELECT_NON_ADMIN)
+
+    @ttl_cache(seconds=15)
+    def get_employee_count(self):
+        result = self.db.fetch_one(EmployeeModel.Q_COUNT)
+        return result['cnt'] if result else 0
+
+    # ── Create ──
+    def _validate_employee(self, employee_data):
+        """Return an error message for invalid employee form data, else None"""
+        required_fields = ['full_name', 'position', 'department']
+        for field in required_fields:
+            if not employee_data.get(field):
+                return f"Please enter {field.replace('_', ' ').title()}"
+
+        email = employee_data.get('email', '').strip()
+        if email and not self.validate_email(email):
+            return "Please enter a valid email address (e.g., name@example.com)."
+
+        phone = employee_data.get('phone', '').strip()
+        if phone and not self.validate_ph_phone(phone):
+            return ("Please enter a valid Philippine phone number.\n\n"
+                    "Accepted formats:\n    09XXXXXXXXX\n    +639XXXXXXXXX\n    639XXXXXXXXX")
+        return None
+
+    @staticmethod
+    def _insert_params(employee_data):
+        return (
+            employee_data['full_name'],
+            employee_data['position'],
+            employee_data['department'],
+            employee_data.get('email', ''),
+            employee_data.get('phone', ''),
+            employee_data.get('leave_credits', 15),
+            employee_data.get('shift_id')
+        )
+
+    def add_employee(self, employee_data):
+        """
+        Validate and insert a new employee.
+        Returns (employee_id, None) on success, (None, error_message) on failure.
+        """
+        error = self._validate_employee(employee_data)
+        if error:
+            return None, error
+
+        if self.db.execute_prepared(EmployeeModel.Q_INSERT, self._insert_params(employee_data)):
+            self.get_employee_count.cache_clear()
+            StaffDashboardController.clear_employee_caches()
+            return self.db.get_last_insert_id(), None
+        return None, "Failed to add employee. Please try again."
+
+    def add_employee_many(self, rows):
+        """
+        Validate and insert many employees in one batch (e.g. a CSV import).
+        Invalid rows are skipped. Returns (inserted_count, [error_message, ...]).
+        """
+        params_list, errors = [], []
+        for index, employee_data in enumerate(rows, start=1):
+            error = self._validate_employee(employee_data)
+            if error:
+                errors.append(f"Row {index}: {error}")
+            else:
+                params_list.append(self._insert_params(employee_data))
+
+        if not params_list:
+            return 0, errors
+        with self.db.transaction():
+            inserted = self.db.execute_many(EmployeeModel.Q_INSERT, params_list)
+        self.get_employee_count.cache_clear()
+        StaffDashboardController.clear_employee_caches()
+        if inserted is None:
+            return 0, errors + ["Failed to add employees. No rows were saved."]
+        return inserted, errors
+
+    # ── Update ──
+    def update_employee(self, employee_id, employee_data):
+        """
+        Validate and update an employee record.
+        Returns (True, None) on success, (False, error_message) on failure.
+        """
+        error = self._validate_employee(employee_data)
+        if error:
+            return False, error
+
+        shift_id = employee_data.get('shift_id')
+        params = (
+            employee_data['full_name'],
+            employee_data['position'],
+            employee_data['department'],
+            employee_data.get('email', ''),
+            employee_data.get('phone', ''),
+            shift_id,
+            employee_id
+        )
+        success = self.db.execute_query(EmployeeModel.Q_UPDATE, params)
+        StaffDashboardController.clear_employee_caches()
+        if shift_id is not None:
+            AttendanceController.clear_shift_cache()
+
+        if success:
+            return True, None
+        return False, "Failed to update employee. Please try again."
+
+    # ── Delete / Deactivate ──
+    def deactivate_employee(self, employee_id):
+        """Deactivate an employee. Returns True/False."""
+        success = bool(self.db.execute_query(EmployeeModel.Q_DEACTIVATE, (employee_id,)))
+        StaffDashboardController.clear_employee_caches()
+        return success
+
+    def delete_employee(self, employee_id):
+        """Permanently delete employee and all cascade-related records. Returns True/False."""
+        # Dependent rows go through ON DELETE CASCADE / SET NULL foreign keys
+        # (migrations/add_employee_delete_cascades.sql)
+        success = bool(self.db.execute_query(EmployeeModel.Q_DELETE, (employee_id,)))
+        self.get_employee_count.cache_clear()
+        StaffDashboardController.clear_employee_caches()
+        LoginController.clear_auth_cache()
+        return success
+
+    # ── Leave Credits ──
+    def update_leave_credits(self, employee_id, leave_credits):
+        """
+        Update leave credits for an employee.
+        Returns (True, None) on success, (False, error_message) on failure.
+        """
+        if leave_credits < 0:
+            return False, "Leave credits cannot be negative."
+        success = self.db.execute_query(EmployeeModel.Q_UPDATE_LEAVE_CREDITS,
+                                        (leave_credits, employee_id))
+        if success:
+            StaffDashboardController.clear_employee_caches()
+            return True, None
+        return False, "Failed to update leave credits. Please try again."
+
+    # ── User Account Operations (delegates to UserController) ──
+    def get_user_by_username(self, username):
+        return self.users.get_user_by_username(username)
+
+    def get_user_by_employee_id(self, employee_id):
+        return self.users.get_user_by_employee_id(employee_id)
+
+    def get_user_by_id(self, user_id):
+        return self.users.get_user_by_id(user_id)
+
+    def create_user(self, employee_id, username, password, role):
+        return self.users.create_user(employee_id, username, password, role)
+
+    def change_password(self, user_id, old_password, new_password):
+        return self.users.change_password(user_id, old_password, new_password)
+
+    def update_password(self, user_id, new_password):
+        return self.users.update_password(user_id, new_password)
+
+# Shared controller instance
+employee_controller = EmployeeController()
@@ -6,6 +6,13 @@ Zero UI imports. Returns result tuples for the view to display.
 
 from models.database import db
 from models.user_model import UserModel
+from utils.ttl_cache import ttl_cache
+
+
+@ttl_cache(seconds=5, maxsize=256)
+def _auth_lookup(username):
+    """Short-lived account lookup, so retries skip the DB"""
+    return db.fetch_one_prepared(UserModel.Q_AUTHENTICATE, (username,))
 
 
 class LoginController:
@@ -24,15 +31,27 @@ class LoginController:
             return (None, "Validation Error",
                     "Please enter both username and password.", "warning")
 
-        password_hash = UserModel.hash_password(password)
-        user = self.db.fetch_one(UserModel.Q_AUTHENTICATE, (username, password_hash))
-
-        if user:
+        user = _auth_lookup(username)
+        if user and UserModel.verify_password(user['password_hash'], password):
+            if UserModel.needs_rehash(user['password_hash']):
+                self._upgrade_hash(user, password)
             self.current_user = user
             return (user, "Login Successful",
                     f"Welcome, {user['full_name']}!", "info")
         return (None, "Login Failed",
                 "Invalid username or password.\nPlease try again.", "warning")
 
+    def _upgrade_hash(self, user, password):
+        """Re-store a legacy hash with the current scheme now that the password is known"""
+        new_hash = UserModel.hash_password(password)
+        if self.db.execute_rowcount(UserModel.Q_CHANGE_PASSWORD,
+                                    (new_hash, user['id'], user['password_hash'])):
+            self.clear_auth_cache()
+
+    @staticmethod
+    def clear_auth_cache():
+        """Drop cached logins after a password or account status change"""
+        _auth_lookup.cache_clear()
+
     def get_current_user(self):
         return self.current_user
@@ -1,112 +1,137 @@
-"""
-Shift Controller (MVC)
-Handles all shift management business logic and database operations.
-"""
-
-from datetime import datetime
-from models.database import db
-from models.shift_model import ShiftModel
-
-
-class ShiftController:
-    """Controller for shift management operations"""
-
-    def __init__(self):
-        self.db = db
-
-    # ── Read Operations ──
-    def get_all_shifts(self, include_inactive=False):
-        """Get all shifts, optionally including inactive"""
-        if include_inactive:
-            return self.db.fetch_all(ShiftModel.Q_SELECT_ALL)
-        return self.db.fetch_all(ShiftModel.Q_SELECT_ALL_ACTIVE)
-
-    def get_shift_by_id(self, shift_id):
-        """Get a shift by ID"""
-        return self.db.fetch_one(ShiftModel.Q_SELECT_BY_ID, (shift_id,))
-
-    def get_default_shift(self):
-        """Get the default shift, with fallback to first active shift"""
-        result = self.db.fetch_one(ShiftModel.Q_SELECT_DEFAULT)
-        if not result:
-            result = self.db.fetch_one(ShiftModel.Q_SELECT_FIRST_ACTIVE)
-        return result
-
-    def get_employee_shift(self, employee_id):
-        """Get shift assigned to an employee, with fallback to default"""
-        result = self.db.fetch_one(ShiftModel.Q_SELECT_EMPLOYEE_SHIFT,
-                                   (employee_id,))
-        if not result:
-            return self.get_default_shift()
-        return result
-
-    # ── Create / Update / Delete ──
-    def create_shift(self, shift_name, start_time, end_time, work_hours=8.0,
-                     grace_period_mins=15, min_hours_before_lunch=3.0, is_default=False):
-        """Create a new shift"""
-        if is_default:
-            self.db.execute_query(ShiftModel.Q_UNSET_ALL_DEFAULTS)
-
-        params = (shift_name, start_time, end_time, work_hours,
-                  grace_period_mins, min_hours_before_lunch, is_default)
-        if self.db.execute_query(ShiftModel.Q_INSERT, params):
-            return self.db.get_last_insert_id()
-        return None
-
-    def update_shift(self, shift_id, shift_name, start_time, end_time,
-                     work_hours=8.0, grace_period_mins=15,
-                     min_hours_before_lunch=3.0, is_default=False):
-        """Update an existing shift"""
-        if is_default:
-            self.db.execute_query(ShiftModel.Q_UNSET_DEFAULTS_EXCEPT, (shift_id,))
-
-        params = (shift_name, start_time, end_time, work_hours,
-                  grace_period_mins, min_hours_before_lunch, is_default, shift_id)
-        return self.db.execute_query(ShiftModel.Q_UPDATE, params)
-
-    def delete_shift(self, shift_id):
-        """
-        Delete (deactivate) a shift.
-        Returns (success, message) tuple.
-        """
-        result = self.db.fetch_one(ShiftModel.Q_COUNT_EMPLOYEES, (shift_id,))
-        if result and result['count'] > 0:
-            return False, f"Cannot delete shift — {result['count']} employee(s) assigned."
-
-        if self.db.execute_query(ShiftModel.Q_DEACTIVATE, (shift_id,)):
-            return True, "Shift deleted successfully."
-        return False, "Cannot delete the default shift."
-
-    # ── Utility ──
-    @staticmethod
-    def format_shift_display(shift):
-        """Format shift for display — e.g. 'Regular (8:00 AM - 5:00 PM)'."""
-        if not shift:
-            return "No Shift"
-
-        def format_time(time_val):
-            if time_val is None:
-                return "N/A"
-            if isinstance(time_val, str):
-                time_obj = datetime.strptime(time_val, '%H:%M:%S')
-            else:
-                # timedelta from database
-                total_seconds = int(time_val.total_seconds())
-                hours = total_seconds // 3600
-                minutes = (total_seconds % 3600) // 60
-                time_obj = datetime.strptime(f"{hours:02d}:{minutes:02d}:00", '%H:%M:%S')
-            return time_obj.strftime('%I:%M %p').lstrip('0')
-
-        start = format_time(shift['start_time'])
-        end = format_time(shift['end_time'])
-        return f"{shift['shift_name']} ({start} - {end})"
-
-    def get_employees_count(self, shift_id):
-        """Get count of active employees assigned to a shift"""
-        result = self.db.fetch_one(ShiftModel.Q_COUNT_EMPLOYEES, (shift_id,))
-        return result['count'] if result else 0
-
-    def reassign_employees(self, from_shift_id, to_shift_id):
-        """Reassign all employees from one shift to another"""
-        return self.db.execute_query(ShiftModel.Q_REASSIGN_EMPLOYEES,
-                                     (to_shift_id, from_shift_id))
+"""
+Shift Controller (MVC)
+Handles all shift management business logic and database operations.
+"""
+
+from functools import lru_cache
+from models.database import db
+from models.shift_model import ShiftModel
+from controllers.attendance_controller import AttendanceController
+
+
+@lru_cache(maxsize=512)
+def _clock_label(value):
+    """'13:30:00' or 48600 (seconds) -> '1:30 PM'; shifts reuse a handful of times"""
+    if isinstance(value, int):
+        hours, minutes = divmod(value // 60, 60)
+    else:
+        hours, minutes, seconds = (int(part) for part in value.split(':'))
+        if not 0 <= minutes < 60 or not 0 <= seconds < 60:
+            raise ValueError(f"invalid time: {value!r}")
+    if not 0 <= hours < 24:
+        raise ValueError(f"invalid time: {value!r}")
+    return f"{hours % 12 or 12}:{minutes:02d} {'AM' if hours < 12 else 'PM'}"
+
+
+class ShiftController:
+    """Controller for shift management operations"""
+
+    def __init__(self):
+        self.db = db
+
+    # ── Read Operations ──
+    def get_all_shifts(self, include_inactive=False):
+        """Get all shifts, optionally including inactive"""
+        query = ShiftModel.Q_SELECT_ALL if include_inactive else ShiftModel.Q_SELECT_ALL_ACTIVE
+        return self.db.fetch_all_cached(query, tables=(ShiftModel.TABLE,))
+
+    def get_shift_by_id(self, shift_id):
+        """Get a shift by ID"""
+        return self.db.fetch_one_prepared(ShiftModel.Q_SELECT_BY_ID, (shift_id,))
+
+    def get_default_shift(self):
+        """Get the default shift, with fallback to first active shift"""
+        result = self.db.fetch_one_prepared(ShiftModel.Q_SELECT_DEFAULT, ())
+        if not result:
+            result = self.db.fetch_one_prepared(ShiftModel.Q_SELECT_FIRST_ACTIVE, ())
+        return result
+
+    def get_employee_shift(self, employee_id):
+        """Get shift assigned to an employee, with fallback to default"""
+        return self.db.fetch_one_prepared(ShiftModel.Q_SELECT_EMPLOYEE_SHIFT_OR_FALLBACK,
+                                          (employee_id,))
+
+    # ── Create / Update / Delete ──
+    def create_shift(self, shift_name, start_time, end_time, work_hours=8.0,
+                     grace_period_mins=15, min_hours_before_lunch=3.0, is_default=False):
+        """Create a new shift"""
+        params = (shift_name, start_time, end_time, work_hours,
+                  grace_period_mins, min_hours_before_lunch, is_default)
+        with self.db.transaction():
+            unset = not is_default or self.db.execute_query(ShiftModel.Q_UNSET_ALL_DEFAULTS)
+            success = unset and self.db.execute_query(ShiftModel.Q_INSERT, params)
+        if success:
+            AttendanceController.clear_shift_cache()
+            return self.db.get_last_insert_id()
+        return None
+
+    def update_shift(self, shift_id, shift_name, start_time, end_time,
+                     work_hours=8.0, grace_period_mins=15,
+                     min_hours_before_lunch=3.0, is_default=False):
+        """Update an existing shift"""
+        params = (shift_name, start_time, end_time, work_hours,
+                  grace_period_mins, min_hours_before_lunch, is_default, shift_id)
+        with self.db.transaction():
+            unset = not is_default or self.db.execute_query(ShiftModel.Q_UNSET_DEFAULTS_EXCEPT,
+                                                            (shift_id,))
+            success = unset and self.db.execute_query(ShiftModel.Q_UPDATE, params)
+        AttendanceController.clear_shift_cache()
+        return success
+
+    def delete_shift(self, shift_id):
+        """
+        Delete (deactivate) a shift.
+        Returns (success, message) tuple.
+        """
+        result = self.db.fetch_one(ShiftModel.Q_COUNT_EMPLOYEES, (shift_id,))
+        if result and result['count'] > 0:
+            return False, f"Cannot delete shift — {result['count']} employee(s) assigned."
+
+        if self.db.execute_query(ShiftModel.Q_DEACTIVATE, (shift_id,)):
+            AttendanceController.clear_shift_cache()
+            return True, "Shift deleted successfully."
+        return False, "Cannot delete the default shift."
+
+    # ── Utility ──
+    @staticmethod
+    def format_clock_time(time_val):
+        """Format a TIME value (timedelta from the DB, or 'HH:MM:SS') as '8:00 AM'."""
+        if hasattr(time_val, 'total_seconds'):
+            return _clock_label(int(time_val.total_seconds()))
+        return _clock_label(str(time_val))
+
+    @staticmethod
+    def format_shift_display(shift):
+        """Format shift for display — e.g. 'Regular (8:00 AM - 5:00 PM)'."""
+        if not shift:
+            return "No Shift"
+
+        def format_time(time_val):
+            if time_val is None:
+                return "N/A"
+            return ShiftController.format_clock_time(time_val)
+
+        start = format_time(shift['start_time'])
+        end = format_time(shift['end_time'])
+        return f"{shift['shift_name']} ({start} - {end})"
+
+    def get_employees_count(self, shift_id):
+        """Get count of active employees assigned to a shift"""
+        result = self.db.fetch_one(ShiftModel.Q_COUNT_EMPLOYEES, (shift_id,))
+        return result['count'] if result else 0
+
+    def list_assigned_employee_ids(self, shift_id):
+        """Get ids of all active employees on a shift in one query"""
+        rows = self.db.fetch_all(ShiftModel.Q_SELECT_EMPLOYEE_IDS_BY_SHIFT, (shift_id,))
+        return [row['id'] for row in rows] if rows else []
+
+    def reassign_employees(self, from_shift_id, to_shift_id):
+        """Reassign all employees from one shift to another"""
+        success = self.db.execute_query(ShiftModel.Q_REASSIGN_EMPLOYEES,
+                                        (to_shift_id, from_shift_id))
+        AttendanceController.clear_shift_cache()
+        return success
+
+
+# Shared controller instance
+shift_controller = ShiftController()
@@ -0,0 +1,57 @@
+-- Migration: Add attendance_daily_stats summary table
+-- Description: Pre-aggregated per-day dashboard counters. MySQL has no
+--              materialized views, so the table is refreshed nightly by an
+--              event; today's in-progress numbers are always computed live.
+
+USE worklog_db;
+
+CREATE TABLE IF NOT EXISTS attendance_daily_stats (
+    date DATE PRIMARY KEY,
+    total INT NOT NULL DEFAULT 0 COMMENT 'Non-admin employees',
+    present INT NOT NULL DEFAULT 0,
+    late INT NOT NULL DEFAULT 0,
+    on_leave INT NOT NULL DEFAULT 0,
+    refreshed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+DROP PROCEDURE IF EXISTS sp_refresh_attendance_daily_stats;
+
+DELIMITER $$
+CREATE PROCEDURE sp_refresh_attendance_daily_stats(IN p_from DATE, IN p_to DATE)
+BEGIN
+    REPLACE INTO attendance_daily_stats (date, total, present, late, on_leave)
+    WITH RECURSIVE days (d) AS (
+        SELECT p_from
+        UNION ALL
+        SELECT d + INTERVAL 1 DAY FROM days WHERE d < p_to
+    )
+    SELECT d,
+           (SELECT COUNT(*) FROM employees e
+            LEFT JOIN users u ON e.id = u.employee_id
+            WHERE u.role IS NULL OR u.role != 'Admin'),
+           (SELECT COUNT(*) FROM attendance a WHERE a.date = d),
+           (SELECT COUNT(*) FROM attendance a
+            WHERE a.date = d AND a.status LIKE '%Late%'),
+           (SELECT COUNT(*) FROM leave_requests l
+            WHERE l.status = 'Approved' AND l.start_date <= d AND l.end_date >= d)
+    FROM days;
+END$$
+DELIMITER ;
+
+-- Backfill every past day that has attendance data
+-- If the history is longer than 1000 days, raise the recursion limit first:
+--   MySQL:   SET SESSION cte_max_recursion_depth = 100000;
+--   MariaDB: SET SESSION max_recursive_iterations = 100000;
+CALL sp_refresh_attendance_daily_stats(
+    (SELECT COALESCE(MIN(date), CURRENT_DATE - INTERVAL 1 DAY) FROM attendance),
+    CURRENT_DATE - INTERVAL 1 DAY);
+
+-- Nightly refresh of the trailing month, so back-dated leave approvals
+-- are picked up. Requires the event scheduler: SET GLOBAL event_scheduler = ON;
+-- lasts only until MySQL restarts, so also add event_scheduler=ON under
+-- [mysqld] in my.ini (XAMPP: C:\xampp\mysql\bin\my.ini).
+CREATE EVENT IF NOT EXISTS ev_refresh_attendance_daily_stats
+ON SCHEDULE EVERY 1 DAY
+STARTS (CURRENT_DATE + INTERVAL 1 DAY + INTERVAL 5 MINUTE)
+DO CALL sp_refresh_attendance_daily_stats(
+    CURRENT_DATE - INTERVAL 31 DAY, CURRENT_DATE - INTERVAL 1 DAY);
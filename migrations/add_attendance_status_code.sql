@@ -0,0 +1,63 @@
+-- Migration: Add attendance.status_code bit flags
+-- Description: Mirrors the comma-separated status text as bit flags so the
+--              late / on-time filters and counters can use an index instead
+--              of LIKE '%Late%' scans.
+--                1 = On Time, 2 = Late, 4 = Complete, 8 = Undertime
+--                0 = Incomplete (not checked out yet)
+--              The app writes status_code together with status at check-out.
+
+USE worklog_db;
+
+-- ADD COLUMN IF NOT EXISTS is MariaDB-only, so check information_schema
+-- instead; the script runs unchanged on MySQL and MariaDB
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM INFORMATION_SCHEMA.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'attendance'
+       AND COLUMN_NAME = 'status_code') = 0,
+    'ALTER TABLE attendance
+        ADD COLUMN status_code TINYINT UNSIGNED NOT NULL DEFAULT 0
+        COMMENT ''Bit flags: 1 On Time, 2 Late, 4 Complete, 8 Undertime'' AFTER status',
+    'DO 0');
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+-- Backfill from the status text. FIND_IN_SET matches whole parts, so
+-- 'Incomplete' is not mistaken for 'Complete'.
+UPDATE attendance
+SET status_code =
+      (FIND_IN_SET('On Time',   REPLACE(status, ', ', ',')) > 0) * 1
+    | (FIND_IN_SET('Late',      REPLACE(status, ', ', ',')) > 0) * 2
+    | (FIND_IN_SET('Complete',  REPLACE(status, ', ', ',')) > 0) * 4
+    | (FIND_IN_SET('Undertime', REPLACE(status, ', ', ',')) > 0) * 8
+WHERE status IS NOT NULL;
+
+-- "Late" is status_code IN (6, 10): Late + Complete or Late + Undertime
+CREATE INDEX idx_attendance_date_status_code ON attendance(date, status_code);
+CREATE INDEX idx_attendance_employee_status_code ON attendance(employee_id, status_code);
+
+-- Nightly summary (migrations/add_attendance_daily_stats.sql) now counts late
+-- rows through the new index as well
+DROP PROCEDURE IF EXISTS sp_refresh_attendance_daily_stats;
+
+DELIMITER $$
+CREATE PROCEDURE sp_refresh_attendance_daily_stats(IN p_from DATE, IN p_to DATE)
+BEGIN
+    REPLACE INTO attendance_daily_stats (date, total, present, late, on_leave)
+    WITH RECURSIVE days (d) AS (
+        SELECT p_from
+        UNION ALL
+        SELECT d + INTERVAL 1 DAY FROM days WHERE d < p_to
+    )
+    SELECT d,
+           (SELECT COUNT(*) FROM employees e
+            LEFT JOIN users u ON e.id = u.employee_id
+            WHERE u.role IS NULL OR u.role != 'Admin'),
+           (SELECT COUNT(*) FROM attendance a WHERE a.date = d),
+           (SELECT COUNT(*) FROM attendance a
+            WHERE a.date = d AND a.status_code IN (6, 10)),
+           (SELECT COUNT(*) FROM leave_requests l
+            WHERE l.status = 'Approved' AND l.start_date <= d AND l.end_date >= d)
+    FROM days;
+END$$
+DELIMITER ;
@@ -0,0 +1,37 @@
+-- Migration: Employee code sequence
+-- Description: New employees take their EMPnnn code from a one-row counter
+--              instead of a MAX() over every employee_code on each insert.
+--              The app inserts employee_code blank and a BEFORE INSERT
+--              trigger numbers each row, so multi-row inserts (CSV import)
+--              get consecutive codes too.
+
+USE worklog_db;
+
+CREATE TABLE IF NOT EXISTS employee_code_seq (
+    next_val INT UNSIGNED NOT NULL COMMENT 'Last issued EMPnnn number'
+) ENGINE=InnoDB;
+
+-- (Re)seed from the highest existing code; safe to run again
+DELETE FROM employee_code_seq;
+INSERT INTO employee_code_seq (next_val)
+SELECT COALESCE(MAX(CAST(SUBSTRING(employee_code, 4) AS UNSIGNED)), 0)
+FROM employees
+WHERE employee_code REGEXP '^EMP[0-9]+$';
+
+DROP TRIGGER IF EXISTS trg_employees_assign_code;
+
+DELIMITER $$
+CREATE TRIGGER trg_employees_assign_code
+BEFORE INSERT ON employees
+FOR EACH ROW
+BEGIN
+    DECLARE n INT UNSIGNED;
+    IF NEW.employee_code IS NULL OR NEW.employee_code = '' THEN
+        -- The UPDATE row lock is held to the end of the insert's transaction,
+        -- so concurrent inserts queue here instead of reading the same value
+        UPDATE employee_code_seq SET next_val = next_val + 1;
+        SELECT next_val INTO n FROM employee_code_seq;
+        SET NEW.employee_code = CONCAT('EMP', LPAD(n, GREATEST(3, LENGTH(n)), '0'));
+    END IF;
+END$$
+DELIMITER ;
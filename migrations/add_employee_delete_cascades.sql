@@ -0,0 +1,35 @@
+-- Migration: Let the database cascade employee deletes
+-- Run this in phpMyAdmin or MySQL command line
+--
+-- attendance, users, leave_requests and late_considerations already cascade on
+-- employee_id, and leave_requests.reviewed_by is already ON DELETE SET NULL.
+-- This fixes the remaining foreign keys so that a single
+-- DELETE FROM employees WHERE id = ? removes the whole object graph.
+-- The constraint names are the ones MySQL generated for the unnamed keys in
+-- add_overtime_requests_table.sql / add_late_considerations_table.sql;
+-- check SHOW CREATE TABLE if your database differs.
+--
+-- Required: EmployeeController.delete_employee no longer deletes child rows
+-- itself, so without this migration deleting an employee who has overtime
+-- or reviewed late considerations fails with a foreign key error.
+
+USE worklog_db;
+
+-- overtime_requests.employee_id -> CASCADE, reviewed_by -> SET NULL
+ALTER TABLE overtime_requests
+    DROP FOREIGN KEY overtime_requests_ibfk_1,
+    DROP FOREIGN KEY overtime_requests_ibfk_2;
+
+ALTER TABLE overtime_requests
+    ADD CONSTRAINT fk_overtime_employee
+        FOREIGN KEY (employee_id) REFERENCES employees(id) ON DELETE CASCADE,
+    ADD CONSTRAINT fk_overtime_reviewer
+        FOREIGN KEY (reviewed_by) REFERENCES employees(id) ON DELETE SET NULL;
+
+-- late_considerations.reviewed_by -> SET NULL
+ALTER TABLE late_considerations
+    DROP FOREIGN KEY late_considerations_ibfk_2;
+
+ALTER TABLE late_considerations
+    ADD CONSTRAINT fk_late_reviewer
+        FOREIGN KEY (reviewed_by) REFERENCES employees(id) ON DELETE SET NULL;
@@ -0,0 +1,14 @@
+-- Migration: Composite index for the dashboard "on leave today" lookup
+-- Run this in phpMyAdmin or MySQL command line
+--
+-- attendance already has idx_date and unique_employee_date (employee_id, date),
+-- and overtime_requests / late_considerations already index status, so only
+-- the leave range predicate (status = 'Approved' AND start_date <= d AND end_date >= d)
+-- is missing a matching index.
+
+USE worklog_db;
+
+CREATE INDEX idx_leave_status_range ON leave_requests(status, start_date, end_date);
+
+-- idx_status is a left prefix of the new index and no longer needed
+ALTER TABLE leave_requests DROP INDEX idx_status;
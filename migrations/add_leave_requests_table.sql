@@ -1,25 +1,25 @@
--- =====================================================
--- Add Leave Requests Table
--- =====================================================
-
-USE worklog_db;
-
-CREATE TABLE IF NOT EXISTS leave_requests (
-    id INT AUTO_INCREMENT PRIMARY KEY,
-    employee_id INT NOT NULL,
-    leave_type ENUM('Sick Leave', 'Vacation Leave', 'Emergency Leave', 'Personal Leave') NOT NULL,
-    start_date DATE NOT NULL,
-    end_date DATE NOT NULL,
-    days_count INT NOT NULL COMMENT 'Number of leave days',
-    reason TEXT,
-    status ENUM('Pending', 'Approved', 'Rejected') DEFAULT 'Pending',
-    requested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    reviewed_by INT COMMENT 'Admin user ID who approved/rejected',
-    reviewed_at TIMESTAMP NULL,
-    remarks TEXT COMMENT 'Admin remarks on approval/rejection',
-    FOREIGN KEY (employee_id) REFERENCES employees(id) ON DELETE CASCADE,
-    FOREIGN KEY (reviewed_by) REFERENCES users(id) ON DELETE SET NULL,
-    INDEX idx_employee_id (employee_id),
-    INDEX idx_status (status),
-    INDEX idx_dates (start_date, end_date)
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+-- =====================================================
+-- Add Leave Requests Table
+-- =====================================================
+
+USE worklog_db;
+
+CREATE TABLE IF NOT EXISTS leave_requests (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    employee_id INT NOT NULL,
+    leave_type ENUM('Sick Leave', 'Vacation Leave', 'Emergency Leave', 'Personal Leave') NOT NULL,
+    start_date DATE NOT NULL,
+    end_date DATE NOT NULL,
+    days_count INT NOT NULL COMMENT 'Number of leave days',
+    reason TEXT,
+    status ENUM('Pending', 'Approved', 'Rejected') DEFAULT 'Pending',
+    requested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    reviewed_by INT COMMENT 'Admin user ID who approved/rejected',
+    reviewed_at TIMESTAMP NULL,
+    remarks TEXT COMMENT 'Admin remarks on approval/rejection',
+    FOREIGN KEY (employee_id) REFERENCES employees(id) ON DELETE CASCADE,
+    FOREIGN KEY (reviewed_by) REFERENCES users(id) ON DELETE SET NULL,
+    INDEX idx_employee_id (employee_id),
+    INDEX idx_status (status),
+    INDEX idx_dates (start_date, end_date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
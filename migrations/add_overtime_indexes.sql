@@ -0,0 +1,20 @@
+-- Migration: Composite indexes for the overtime request lookups
+-- Run this in phpMyAdmin or MySQL command line
+--
+-- The single-column indexes from add_overtime_requests_table.sql leave MySQL
+-- filtering and sorting the rest of each predicate row by row:
+--   * monthly total / pending check: employee_id = ? AND status = ? AND request_date range
+--   * admin pending list:             status = 'Pending' ORDER BY request_date, created_at
+--   * employee notifications:         employee_id = ? AND employee_notified = 0 AND status IN (...)
+
+USE worklog_db;
+
+CREATE INDEX idx_ot_employee_status_date ON overtime_requests(employee_id, status, request_date);
+CREATE INDEX idx_ot_status_date ON overtime_requests(status, request_date, created_at);
+CREATE INDEX idx_ot_employee_notified ON overtime_requests(employee_id, employee_notified, status);
+
+-- Left prefixes of the new indexes and no longer needed
+-- (the employee_id foreign key is served by idx_ot_employee_status_date)
+ALTER TABLE overtime_requests
+    DROP INDEX idx_overtime_employee,
+    DROP INDEX idx_overtime_status;
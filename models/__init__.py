@@ -1,17 +1,17 @@
-"""
-Models Package
-Data models and database operations for Work Log application
-"""
-
-from .database import db
-from .employee_model import EmployeeModel
-from .user_model import UserModel
-from .attendance_model import AttendanceModel
-from .leave_model import LeaveModel
-from .overtime_model import OvertimeModel
-from .shift_model import ShiftModel
-
-__all__ = [
-    'db', 'EmployeeModel', 'UserModel', 'AttendanceModel',
-    'LeaveModel', 'OvertimeModel', 'ShiftModel',
-]
+"""
+Models Package
+Data models and database operations for Work Log application
+"""
+
+from .database import db
+from .employee_model import EmployeeModel
+from .user_model import UserModel
+from .attendance_model import AttendanceModel
+from .leave_model import LeaveModel
+from .overtime_model import OvertimeModel
+from .shift_model import ShiftModel
+
+__all__ = [
+    'db', 'EmployeeModel', 'UserModel', 'AttendanceModel',
+    'LeaveModel', 'OvertimeModel', 'ShiftModel',
+]
@@ -1,133 +1,197 @@
-"""
-Attendance Model — Pure Blueprint (MVC)
-Contains ONLY: TABLE name, FIELDS list, and SQL query constants.
-Zero database imports. Zero query execution.
-"""
-
-class AttendanceModel:
-    """Data structure, SQL query holder, and pure computation for attendance"""
-
-    TABLE = 'attendance'
-
-    FIELDS = [
-        'id', 'employee_id', 'date', 'time_in', 'time_out',
-        'lunch_start', 'lunch_end', 'total_time', 'lunch_duration',
-        'paid_hours', 'overtime_hours', 'status', 'created_at', 'updated_at'
-    ]
-
-    # Standard working hours per day
-    STANDARD_WORKING_HOURS = 8
-
-    # ── SQL Query Constants ──
-    Q_CHECK_IN = """
-        INSERT INTO attendance (employee_id, date, time_in, status)
-        VALUES (%s, %s, %s, 'Incomplete')
-    """
-
-    Q_START_LUNCH = """
-        UPDATE attendance SET lunch_start = %s
-        WHERE employee_id = %s AND date = %s
-    """
-
-    Q_END_LUNCH = """
-        UPDATE attendance SET lunch_end = %s
-        WHERE employee_id = %s AND date = %s
-    """
-
-    Q_CHECK_OUT = """
-        UPDATE attendance
-        SET time_out = %s, total_time = %s, lunch_duration = %s,
-            paid_hours = %s, overtime_hours = %s, status = %s
-        WHERE employee_id = %s AND date = %s
-    """
-
-    Q_GET_TODAY = "SELECT * FROM attendance WHERE employee_id = %s AND date = %s"
-
-    Q_GET_EMPLOYEE = "SELECT * FROM attendance WHERE employee_id = %s ORDER BY date DESC"
-
-    Q_GET_EMPLOYEE_RANGE = """
-        SELECT * FROM attendance
-        WHERE employee_id = %s AND date BETWEEN %s AND %s
-        ORDER BY date DESC
-    """
-
-    Q_GET_ALL_BY_DATE = """
-        SELECT a.*, e.employee_code, e.full_name, e.position, e.department,
-               s.shift_name, s.start_time as shift_start, s.end_time as shift_end
-        FROM attendance a
-        INNER JOIN employees e ON a.employee_id = e.id
-        LEFT JOIN shifts s ON e.shift_id = s.id
-        WHERE a.date = %s
-        ORDER BY a.time_in
-    """
-
-    Q_COUNT_PRESENT = "SELECT COUNT(*) as count FROM attendance WHERE date = %s"
-
-    Q_COUNT_LATE = """
-        SELECT COUNT(*) as count FROM attendance
-        WHERE date = %s AND status LIKE '%%Late%%'
-    """
-
-    Q_COUNT_TOTAL_ACTIVE = "SELECT COUNT(*) as count FROM employees WHERE status = 'Active'"
-
-    Q_GET_DEPARTMENT = """
-        SELECT a.*, e.employee_code, e.full_name, e.position, e.department
-        FROM attendance a
-        INNER JOIN employees e ON a.employee_id = e.id
-        WHERE e.department = %s AND a.date = %s
-        ORDER BY a.time_in
-    """
-
-    Q_WEEKLY_SUMMARY = """
-        SELECT a.date,
-               COUNT(*) as present_count,
-               SUM(CASE WHEN a.status LIKE '%%Late%%' THEN 1 ELSE 0 END) as late_count
-        FROM attendance a
-        WHERE a.date BETWEEN %s AND %s
-        GROUP BY a.date
-        ORDER BY a.date
-    """
-
-    # ── Employee-specific queries ──
-    Q_GET_EMPLOYEE_LATE = """
-        SELECT * FROM attendance
-        WHERE employee_id = %s AND status LIKE '%%Late%%'
-        ORDER BY date DESC
-    """
-
-    Q_GET_EMPLOYEE_STATS = """
-        SELECT
-            COUNT(*) as total_days,
-            SUM(CASE WHEN status LIKE '%%On Time%%' THEN 1 ELSE 0 END) as on_time_days,
-            SUM(CASE WHEN status LIKE '%%Late%%' THEN 1 ELSE 0 END) as late_days,
-            SUM(CASE WHEN status LIKE '%%Complete%%' THEN 1 ELSE 0 END) as complete_days,
-            SUM(CASE WHEN status LIKE '%%Undertime%%' THEN 1 ELSE 0 END) as undertime_days,
-            COALESCE(SUM(paid_hours), 0) as total_paid_hours,
-            COALESCE(AVG(paid_hours), 0) as avg_paid_hours
-        FROM attendance
-        WHERE employee_id = %s
-    """
-
-    Q_GET_EMPLOYEE_WEEKLY = """
-        SELECT a.date,
-               CASE WHEN a.status LIKE '%%Late%%' THEN 1 ELSE 0 END as is_late,
-               CASE WHEN a.status LIKE '%%On Time%%' THEN 1 ELSE 0 END as is_on_time,
-               a.paid_hours
-        FROM attendance a
-        WHERE a.employee_id = %s AND a.date BETWEEN %s AND %s
-        ORDER BY a.date
-    """
-
-    Q_GET_EMPLOYEE_MONTHLY_SUMMARY = """
-        SELECT
-            DATE_FORMAT(date, '%%Y-%%m') as month,
-            COUNT(*) as total_days,
-            SUM(CASE WHEN status LIKE '%%Late%%' THEN 1 ELSE 0 END) as late_days,
-            SUM(CASE WHEN status LIKE '%%On Time%%' THEN 1 ELSE 0 END) as on_time_days,
-            COALESCE(SUM(paid_hours), 0) as total_paid_hours
-        FROM attendance
-        WHERE employee_id = %s
-        GROUP BY DATE_FORMAT(date, '%%Y-%%m')
-        ORDER BY month DESC
-        LIMIT 6
-    """
+"""
+Attendance Model — Pure Blueprint (MVC)
+Contains ONLY: TABLE name, FIELDS list, and SQL query constants.
+Zero database imports. Zero query execution.
+"""
+
+class AttendanceModel:
+    """Data structure, SQL query holder, and pure computation for attendance"""
+
+    TABLE = 'attendance'
+
+    FIELDS = [
+        'id', 'employee_id', 'date', 'time_in', 'time_out',
+        'lunch_start', 'lunch_end', 'total_time', 'lunch_duration',
+        'paid_hours', 'overtime_hours', 'status', 'status_code', 'created_at', 'updated_at'
+    ]
+
+    # Standard working hours per day
+    STANDARD_WORKING_HOURS = 8
+
+    # status_code bit flags, one per part of the status text (0 = Incomplete).
+    # A checked-out row is exactly one of On Time/Late plus one of Complete/Undertime,
+    # so "late" is status_code IN (6, 10), which an index can seek on.
+    STATUS_FLAGS = {'On Time': 1, 'Late': 2, 'Complete': 4, 'Undertime': 8}
+
+    # ── SQL Query Constants ──
+    Q_CHECK_IN = """
+        INSERT INTO attendance (employee_id, date, time_in, status)
+        VALUES (%s, %s, %s, 'Incomplete')
+    """
+
+    # The IS NULL guards make each step write once; a second window or a stale
+    # cached row matches no rows instead of overwriting the recorded time
+    Q_START_LUNCH = """
+        UPDATE attendance SET lunch_start = %s
+        WHERE employee_id = %s AND date = %s
+          AND lunch_start IS NULL AND time_out IS NULL
+    """
+
+    Q_END_LUNCH = """
+        UPDATE attendance SET lunch_end = %s
+        WHERE employee_id = %s AND date = %s
+          AND lunch_start IS NOT NULL AND lunch_end IS NULL
+    """
+
+    Q_CHECK_OUT = """
+        UPDATE attendance
+        SET time_out = %s, total_time = %s, lunch_duration = %s,
+            paid_hours = %s, overtime_hours = %s, status = %s, status_code = %s
+        WHERE employee_id = %s AND date = %s AND time_out IS NULL
+    """
+
+    Q_GET_TODAY = "SELECT * FROM attendance WHERE employee_id = %s AND date = %s"
+
+    # Check-out re-reads the row it computes from, locked until its UPDATE commits
+    Q_GET_TODAY_FOR_UPDATE = """
+        SELECT * FROM attendance WHERE employee_id = %s AND date = %s FOR UPDATE
+    """
+
+    Q_GET_EMPLOYEE = "SELECT * FROM attendance WHERE employee_id = %s ORDER BY date DESC"
+
+    Q_GET_EMPLOYEE_LIMITED = """
+        SELECT * FROM attendance
+        WHERE employee_id = %s
+        ORDER BY date DESC
+        LIMIT %s
+    """
+
+    Q_GET_EMPLOYEE_RANGE = """
+        SELECT * FROM attendance
+        WHERE employee_id = %s AND date BETWEEN %s AND %s
+        ORDER BY date DESC
+    """
+
+    Q_GET_ALL_BY_DATE = """
+        SELECT a.*, e.employee_code, e.full_name, e.position, e.department,
+               s.shift_name, s.start_time as shift_start, s.end_time as shift_end
+        FROM attendance a
+        INNER JOIN employees e ON a.employee_id = e.id
+        LEFT JOIN shifts s ON e.shift_id = s.id
+        WHERE a.date = %s
+        ORDER BY a.time_in
+    """
+
+    Q_COUNT_TOTAL_ACTIVE = "SELECT COUNT(*) as count FROM employees WHERE status = 'Active'"
+
+    Q_DAILY_STATS = """
+        SELECT
+            (SELECT COUNT(*) FROM employees e
+             LEFT JOIN users u ON e.id = u.employee_id
+             WHERE u.role IS NULL OR u.role != 'Admin') as total,
+            (SELECT COUNT(*) FROM attendance WHERE date = %s) as present,
+            (SELECT COUNT(*) FROM attendance
+             WHERE date = %s AND status_code IN (6, 10)) as late,
+            (SELECT COUNT(*) FROM leave_requests
+             WHERE status = 'Approved' AND start_date <= %s AND end_date >= %s) as on_leave
+    """
+
+    # Review queue badges for the admin dashboard, one round trip for all three
+    Q_COUNT_ALL_PENDING = """
+        SELECT
+            (SELECT COUNT(*) FROM leave_requests WHERE status = 'Pending') as leaves,
+            (SELECT COUNT(*) FROM overtime_requests WHERE status = 'Pending') as overtime,
+            (SELECT COUNT(*) FROM late_considerations WHERE status = 'Pending') as late
+    """
+
+    Q_GET_DEPARTMENT = """
+        SELECT a.*, e.employee_code, e.full_name, e.position, e.department
+        FROM attendance a
+        INNER JOIN employees e ON a.employee_id = e.id
+        WHERE e.department = %s AND a.date = %s
+        ORDER BY a.time_in
+    """
+
+    # Past days come from the nightly attendance_daily_stats summary;
+    # today's row is still in progress, so it is aggregated live.
+    Q_DAILY_STATS_HISTORY = """
+        SELECT total, present, late, on_leave
+        FROM attendance_daily_stats
+        WHERE date = %s
+    """
+
+    # One row per day from start to end (inclusive), zero-filled. Past days use
+    # the nightly summary row when there is one; the end day and any past day
+    # the summary has not covered yet are aggregated live.
+    # Params: start, end, end, start, end
+    Q_WEEKLY_SUMMARY = """
+        WITH RECURSIVE days (d) AS (
+            SELECT CAST(%s AS DATE)
+            UNION ALL
+            SELECT d + INTERVAL 1 DAY FROM days WHERE d < %s
+        )
+        SELECT days.d as date,
+               COALESCE(s.present, t.present_count, 0) as present_count,
+               COALESCE(s.late, t.late_count, 0) as late_count,
+               COALESCE(s.present, t.present_count, 0)
+                   - COALESCE(s.late, t.late_count, 0) as on_time_count
+        FROM days
+        LEFT JOIN attendance_daily_stats s ON s.date = days.d AND days.d < %s
+        LEFT JOIN (
+            SELECT a.date,
+                   COUNT(*) as present_count,
+                   SUM(a.status_code & 2 > 0) as late_count
+            FROM attendance a
+            WHERE a.date BETWEEN %s AND %s
+            GROUP BY a.date
+        ) t ON t.date = days.d
+        ORDER BY days.d
+    """
+
+    # ── Employee-specific queries ──
+    Q_GET_EMPLOYEE_LATE = """
+        SELECT * FROM attendance
+        WHERE employee_id = %s AND status_code IN (6, 10)
+        ORDER BY date DESC
+    """
+
+    Q_GET_EMPLOYEE_WEEKLY = """
+        SELECT a.date,
+               a.status_code & 2 > 0 as is_late,
+               a.status_code & 1 > 0 as is_on_time,
+               a.paid_hours
+        FROM attendance a
+        WHERE a.employee_id = %s AND a.date BETWEEN %s AND %s
+        ORDER BY a.date
+    """
+
+    Q_GET_EMPLOYEE_MONTHLY_SUMMARY = """
+        SELECT
+            DATE_FORMAT(date, '%%Y-%%m') as month,
+            COUNT(*) as total_days,
+            SUM(status_code & 2 > 0) as late_days,
+            SUM(status_code & 1 > 0) as on_time_days,
+            COALESCE(SUM(paid_hours), 0) as total_paid_hours
+        FROM attendance
+        WHERE employee_id = %s
+        GROUP BY DATE_FORMAT(date, '%%Y-%%m')
+        ORDER BY month DESC
+        LIMIT 6
+    """
+
+    # Per-month rows plus a ROLLUP total row (month IS NULL) with the
+    # employee's all-time totals, from one scan
+    Q_GET_EMPLOYEE_STATS_BY_MONTH = """
+        SELECT
+            DATE_FORMAT(date, '%%Y-%%m') as month,
+            COUNT(*) as total_days,
+            SUM(status_code & 1 > 0) as on_time_days,
+            SUM(status_code & 2 > 0) as late_days,
+            SUM(status_code & 4 > 0) as complete_days,
+            SUM(status_code & 8 > 0) as undertime_days,
+            COALESCE(SUM(paid_hours), 0) as total_paid_hours,
+            COALESCE(AVG(paid_hours), 0) as avg_paid_hours
+        FROM attendance
+        WHERE employee_id = %s
+        GROUP BY DATE_FORMAT(date, '%%Y-%%m') WITH ROLLUP
+    """
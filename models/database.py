@@ -1,153 +1,575 @@
-"""
-Database Connection Manager
-Handles MySQL database connection using mysql-connector-python
-"""
-
-import mysql.connector
-from mysql.connector import Error
-
-
-class Database:
-    """Database connection singleton class"""
-    
-    _instance = None
-    _connection = None
-    
-    def __new__(cls):
-        """Singleton pattern to ensure only one database connection"""
-        if cls._instance is None:
-            cls._instance = super(Database, cls).__new__(cls)
-        return cls._instance
-    
-    def connect(self, host='localhost', database='worklog_db', user='root', password=''):
-        """
-        Establish database connection
-        
-        Args:
-            host: MySQL host (default: localhost)
-            database: Database name (default: worklog_db)
-            user: MySQL username (default: root)
-            password: MySQL password (default: empty for XAMPP)
-        
-        Returns:
-            connection object or None
-        """
-        try:
-            if self._connection is None or not self._connection.is_connected():
-                self._connection = mysql.connector.connect(
-                    host=host,
-                    database=database,
-                    user=user,
-                    password=password
-                )
-                if self._connection.is_connected():
-                    print(f"Successfully connected to MySQL database: {database}")
-            return self._connection
-        except Error as e:
-            print(f"Error connecting to MySQL: {e}")
-            return None
-    
-    def get_connection(self):
-        """Get the current database connection"""
-        if self._connection and self._connection.is_connected():
-            return self._connection
-        else:
-            return self.connect()
-    
-    def close(self):
-        """Close the database connection"""
-        if self._connection and self._connection.is_connected():
-            self._connection.close()
-            print("Database connection closed")
-    
-    def execute_query(self, query, params=None):
-        """
-        Execute a single query (INSERT, UPDATE, DELETE)
-        
-        Args:
-            query: SQL query string
-            params: Query parameters (optional)
-        
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            connection = self.get_connection()
-            cursor = connection.cursor()
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            connection.commit()
-            cursor.close()
-            return True
-        except Error as e:
-            print(f"Error executing query: {e}")
-            return False
-    
-    def fetch_one(self, query, params=None):
-        """
-        Fetch a single record
-        
-        Args:
-            query: SQL query string
-            params: Query parameters (optional)
-        
-        Returns:
-            Single record or None
-        """
-        try:
-            connection = self.get_connection()
-            cursor = connection.cursor(dictionary=True)
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            result = cursor.fetchone()
-            cursor.close()
-            return result
-        except Error as e:
-            print(f"Error fetching data: {e}")
-            return None
-    
-    def fetch_all(self, query, params=None):
-        """
-        Fetch multiple records
-        
-        Args:
-            query: SQL query string
-            params: Query parameters (optional)
-        
-        Returns:
-            List of records or empty list
-        """
-        try:
-            connection = self.get_connection()
-            cursor = connection.cursor(dictionary=True)
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            results = cursor.fetchall()
-            cursor.close()
-            return results
-        except Error as e:
-            print(f"Error fetching data: {e}")
-            return []
-    
-    def get_last_insert_id(self):
-        """Get the last inserted ID"""
-        try:
-            connection = self.get_connection()
-            cursor = connection.cursor()
-            cursor.execute("SELECT LAST_INSERT_ID()")
-            result = cursor.fetchone()
-            cursor.close()
-            return result[0] if result else None
-        except Error as e:
-            print(f"Error getting last insert ID: {e}")
-            return None
-
-
-# Create a global database instance
-db = Database()
+"""
+Database Connection Manager
+Handles MySQL database connections through a mysql-connector-python pool
+"""
+
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
+
+from mysql.connector import Error
+from mysql.connector.errors import PoolError
+from mysql.connector.pooling import MySQLConnectionPool
+
+from utils.query_cache import MISS, QueryCache
+
+log = logging.getLogger('worklog.db')
+
+
+@lru_cache(maxsize=512)
+def _sql_bytes(query):
+    """Encode a statement once; the connector skips its own per-execute encode for bytes"""
+    return query.encode('utf-8')
+
+
+@lru_cache(maxsize=128)
+def _row_type(columns):
+    """Namedtuple class for a result shape, built once per distinct column list"""
+    return namedtuple('Row', columns, rename=True)
+
+
+def _env_pool_size(default=8):
+    """Pool size from WORKLOG_DB_POOL_SIZE, clamped to what the connector allows (1-32)"""
+    try:
+        size = int(os.environ.get('WORKLOG_DB_POOL_SIZE', default))
+    except ValueError:
+        size = default
+    return max(1, min(size, 32))
+
+
+class Database:
+    """Database connection singleton class backed by a connection pool"""
+    
+    POOL_SIZE = _env_pool_size()
+    POOL_WAIT_SECS = 2.0
+    
+    _instance = None
+    _pool = None
+    _pool_lock = threading.Lock()
+    _local = threading.local()
+    _prepared = weakref.WeakKeyDictionary()  # raw connection -> (server connection_id, {query: cursor})
+    _query_cache = QueryCache(seconds=30)
+    _config = {'host': 'localhost', 'database': 'worklog_db', 'user': 'root', 'password': ''}
+    
+    def __new__(cls):
+        """Singleton pattern to ensure only one connection pool"""
+        if cls._instance is None:
+            cls._instance = super(Database, cls).__new__(cls)
+        return cls._instance
+    
+    def connect(self, host='localhost', database='worklog_db', user='root', password=''):
+        """
+        Create the connection pool
+        
+        Args:
+            host: MySQL host (default: localhost)
+            database: Database name (default: worklog_db)
+            user: MySQL username (default: root)
+            password: MySQL password (default: empty for XAMPP)
+        
+        Returns:
+            pool object or None
+        """
+        try:
+            with self._pool_lock:
+                if Database._pool is None:
+                    Database._config = {'host': host, 'database': database,
+                                        'user': user, 'password': password}
+                    Database._pool = MySQLConnectionPool(
+                        pool_name='worklog',
+                        pool_size=self.POOL_SIZE,
+                        pool_reset_session=False,
+                        autocommit=True,
+                        **self._config
+                    )
+                    log.debug("Connected to MySQL database: %s", database)
+            return Database._pool
+        except Error as e:
+            log.error("Error connecting to MySQL: %s", e)
+            return None
+    
+    def get_connection(self):
+        """Borrow a pooled connection; call close() on it to hand it back"""
+        pool = self._pool or self.connect(**self._config)
+        if pool is None:
+            raise Error("Database connection pool is unavailable")
+        # The connector raises at once when every connection is out; wait briefly instead
+        deadline = time.monotonic() + self.POOL_WAIT_SECS
+        while True:
+            try:
+                connection = pool.get_connection()
+                break
+            except PoolError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.02)
+        connection.ping(reconnect=True)
+        return connection
+    
+    @contextmanager
+    def _checkout(self):
+        """Borrow a pooled connection for one call, or use the thread's open transaction"""
+        pinned = self._pinned()
+        if pinned is not None:
+            yield pinned
+            return
+        connection = self.get_connection()
+        try:
+            yield connection
+        finally:
+            connection.close()
+    
+    def _pinned(self):
+        """The connection this thread's open transaction or session is using, if any"""
+        return getattr(self._local, 'connection', None) or getattr(self._local, 'session', None)
+    
+    def _in_transaction(self):
+        return getattr(self._local, 'connection', None) is not None
+    
+    @contextmanager
+    def session(self):
+        """
+        Serve every query in the block from one pooled connection
+        
+        Saves a checkout and ping per call when a refresh runs several small
+        queries back to back. Nested blocks join the outer one; transactions
+        opened inside run on the session's connection.
+        """
+        if self._pinned() is not None:
+            yield self
+            return
+        connection = self.get_connection()
+        self._local.session = connection
+        try:
+            yield self
+        finally:
+            self._local.session = None
+            connection.close()
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Run the enclosed queries atomically on one connection
+        
+        Commits when the block finishes; rolls back if it raises or if any
+        execute_* call inside it failed. Nested blocks join the outer one.
+        """
+        if self._in_transaction():
+            yield
+            return
+        session = getattr(self._local, 'session', None)
+        connection = session or self.get_connection()
+        self._local.connection = connection
+        self._local.failed = False
+        self._local.writes = []
+        try:
+            connection.start_transaction()
+            yield
+            if self._local.failed:
+                connection.rollback()
+            else:
+                connection.commit()
+                # Other threads may have re-cached old rows before the commit
+                for query in self._local.writes:
+                    self._query_cache.invalidate_statement(query)
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            self._local.connection = None
+            if session is None:
+                connection.close()
+    
+    def _wrote(self, query):
+        """Drop cached results a write touched; again at commit when in a transaction"""
+        self._query_cache.invalidate_statement(query)
+        if self._in_transaction():
+            self._local.writes.append(query)
+    
+    def _prepared_cursor(self, connection, query):
+        """Return the connection's prepared cursor for query, preparing it on first use"""
+        raw = getattr(connection, '_cnx', connection)
+        session_id = raw.connection_id
+        entry = self._prepared.get(raw)
+        if entry is None or entry[0] != session_id:
+            # First use, or the pool/ping reconnected: the new server session
+            # has none of the old statement ids
+            entry = (session_id, {})
+            self._prepared[raw] = entry
+        cursors = entry[1]
+        cursor = cursors.get(query)
+        if cursor is None:
+            cursor = connection.cursor(prepared=True)
+            cursors[query] = cursor
+        return cursor
+    
+    def _discard_prepared(self, connection, query):
+        """Forget a prepared cursor whose statement no longer works (e.g. after reconnect)"""
+        raw = getattr(connection, '_cnx', connection)
+        entry = self._prepared.get(raw)
+        if entry is not None:
+            entry[1].pop(query, None)
+    
+    def close(self):
+        """Close the pool's idle connections and drop the pool"""
+        with self._pool_lock:
+            pool, Database._pool = Database._pool, None
+        if pool is None:
+            return
+        # Drain the idle connections through the public API; any still checked
+        # out go back to the detached pool and close when it is collected
+        while True:
+            try:
+                connection = pool.get_connection()
+            except PoolError:
+                break
+            except Error:
+                continue  # failed to reconnect a dropped one; it has left the queue
+            try:
+                connection.disconnect()
+            except Error:
+                pass
+        log.debug("Database connection closed")
+    
+    def execute_query(self, query, params=None):
+        """
+        Execute a single query (INSERT, UPDATE, DELETE)
+        
+        Args:
+            query: SQL query string
+            params: Query parameters (optional)
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with self._checkout() as connection:
+                with connection.cursor() as cursor:
+                    if params:
+                        cursor.execute(_sql_bytes(query), params)
+                    else:
+                        cursor.execute(_sql_bytes(query))
+                    if not self._in_transaction():
+                        connection.commit()
+                    self._local.last_insert_id = cursor.lastrowid
+            self._wrote(query)
+            return True
+        except Error as e:
+            self._local.failed = True
+            log.error("Error executing query: %s [%.200s]", e, query)
+            return False
+    
+    def execute_rowcount(self, query, params=None):
+        """
+        Execute a write query and report how many rows it changed
+
+        Args:
+            query: SQL query string
+            params: Query parameters (optional)
+
+        Returns:
+            Number of affected rows, or None on error
+        """
+        try:
+            with self._checkout() as connection:
+                with connection.cursor() as cursor:
+                    if params:
+                        cursor.execute(_sql_bytes(query), params)
+                    else:
+                        cursor.execute(_sql_bytes(query))
+                    if not self._in_transaction():
+                        connection.commit()
+                    rowcount = cursor.rowcount
+            self._wrote(query)
+            return rowcount
+        except Error as e:
+            self._local.failed = True
+            log.error("Error executing query: %s [%.200s]", e, query)
+            return None
+    
+    def execute_many(self, query, params_list):
+        """
+        Execute one write query for every parameter tuple in a single call
+        
+        Args:
+            query: SQL query string
+            params_list: Sequence of parameter tuples
+            
+        Returns:
+            Total number of affected rows, or None on error
+        """
+        try:
+            with self._checkout() as connection:
+                with connection.cursor() as cursor:
+                    cursor.executemany(query, params_list)
+                    if not self._in_transaction():
+                        connection.commit()
+                    rowcount = cursor.rowcount
+            self._wrote(query)
+            return rowcount
+        except Error as e:
+            self._local.failed = True
+            log.error("Error executing query: %s [%.200s]", e, query)
+            return None
+    
+    def execute_batch(self, statements):
+        """
+        Execute several write queries on one connection as one transaction
+        
+        Args:
+            statements: Sequence of (query, params) pairs
+            
+        Returns:
+            True if every statement succeeded (all committed), False otherwise (all rolled back)
+        """
+        with self.transaction():
+            for query, params in statements:
+                if not self.execute_query(query, params):
+                    return False
+        return True
+    
+    def execute_prepared(self, query, params):
+        """
+        Execute a hot write query as a server-side prepared statement
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        connection = None
+        try:
+            with self._checkout() as connection:
+                cursor = self._prepared_cursor(connection, query)
+                cursor.execute(query, params)
+                self._local.last_insert_id = cursor.lastrowid
+            self._wrote(query)
+            return True
+        except Error as e:
+            self._local.failed = True
+            if connection is not None:
+                self._discard_prepared(connection, query)
+            log.error("Error executing query: %s [%.200s]", e, query)
+            return False
+    
+    def fetch_one_prepared(self, query, params):
+        """
+        Fetch a single record through a server-side prepared statement
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+        
+        Returns:
+            Single record (dict) or None
+        """
+        connection = None
+        try:
+            with self._checkout() as connection:
+                cursor = self._prepared_cursor(connection, query)
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+                columns = cursor.column_names
+            return dict(zip(columns, rows[0])) if rows else None
+        except Error as e:
+            if connection is not None:
+                self._discard_prepared(connection, query)
+            log.error("Error fetching data: %s [%.200s]", e, query)
+            return None
+    
+    def fetch_all_prepared(self, query, params):
+        """
+        Fetch multiple records through a server-side prepared statement
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+        
+        Returns:
+            List of records (dicts) or empty list
+        """
+        connection = None
+        try:
+            with self._checkout() as connection:
+                cursor = self._prepared_cursor(connection, query)
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+                columns = cursor.column_names
+            return [dict(zip(columns, row)) for row in rows]
+        except Error as e:
+            if connection is not None:
+                self._discard_prepared(connection, query)
+            log.error("Error fetching data: %s [%.200s]", e, query)
+            return []
+    
+    def fetch_one(self, query, params=None):
+        """
+        Fetch a single record
+        
+        Args:
+            query: SQL query string
+            params: Query parameters (optional)
+        
+        Returns:
+            Single record or None
+        """
+        try:
+            with self._checkout() as connection:
+                with connection.cursor(dictionary=True) as cursor:
+                    if params:
+                        cursor.execute(_sql_bytes(query), params)
+                    else:
+                        cursor.execute(_sql_bytes(query))
+                    result = cursor.fetchone()
+            return result
+        except Error as e:
+            log.error("Error fetching data: %s [%.200s]", e, query)
+            return None
+    
+    def fetch_all(self, query, params=None):
+        """
+        Fetch multiple records
+        
+        Args:
+            query: SQL query string
+            params: Query parameters (optional)
+        
+        Returns:
+            List of records or empty list
+        """
+        try:
+            with self._checkout() as connection:
+                with connection.cursor(dictionary=True) as cursor:
+                    if params:
+                        cursor.execute(_sql_bytes(query), params)
+                    else:
+                        cursor.execute(_sql_bytes(query))
+                    results = cursor.fetchall()
+            return results
+        except Error as e:
+            log.error("Error fetching data: %s [%.200s]", e, query)
+            return []
+    
+    def fetch_all_cached(self, query, params=None, tables=()):
+        """
+        fetch_all for read-mostly lookups, served from a shared result cache
+        
+        Entries last 30 seconds and are dropped as soon as any execute_*
+        call writes to one of the listed tables.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters (optional)
+            tables: Tables the query reads, e.g. (EmployeeModel.TABLE,)
+        
+        Returns:
+            List of records or empty list
+        """
+        key = (query, tuple(params) if params else ())
+        results = self._query_cache.get(key)
+        if results is not MISS:
+            return results
+        snapshot = self._query_cache.snapshot(tables)
+        try:
+            with self._checkout() as connection:
+                with connection.cursor(dictionary=True) as cursor:
+                    if params:
+                        cursor.execute(_sql_bytes(query), params)
+                    else:
+                        cursor.execute(_sql_bytes(query))
+                    results = cursor.fetchall()
+        except Error as e:
+            log.error("Error fetching data: %s [%.200s]", e, query)
+            return []
+        # Rows read inside a transaction may yet be rolled back
+        if not self._in_transaction():
+            self._query_cache.put(key, tables, results, snapshot)
+        return results
+    
+    def fetch_all_rows(self, query, params=None):
+        """
+        Fetch multiple records as lightweight namedtuples
+        
+        Cheaper than fetch_all's per-row dicts for large reads whose callers
+        only need attribute access (row.full_name).
+        
+        Args:
+            query: SQL query string
+            params: Query parameters (optional)
+        
+        Returns:
+            List of namedtuples or empty list
+        """
+        try:
+            with self._checkout() as connection:
+                with connection.cursor() as cursor:
+                    if params:
+                        cursor.execute(_sql_bytes(query), params)
+                    else:
+                        cursor.execute(_sql_bytes(query))
+                    rows = cursor.fetchall()
+                    row_type = _row_type(tuple(cursor.column_names))
+            return list(map(row_type._make, rows))
+        except Error as e:
+            log.error("Error fetching data: %s [%.200s]", e, query)
+            return []
+    
+    def iter_all(self, query, params=None, batch_size=1000):
+        """
+        Stream records from an unbuffered cursor instead of loading them all
+        
+        Always checks out its own pooled connection, held until the generator
+        is exhausted or closed, so other queries on this thread (including a
+        session or transaction) can run while rows are still unread.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters (optional)
+            batch_size: Rows pulled from the server per round-trip
+        
+        Yields:
+            Records as dictionaries
+        
+        Raises:
+            Error: the query or a later fetch failed; unlike fetch_all this is
+            not swallowed, so a consumer can't mistake a cut-off stream for
+            the full result
+        """
+        try:
+            connection = self.get_connection()
+            try:
+                cursor = connection.cursor(dictionary=True, buffered=False)
+                try:
+                    if params:
+                        cursor.execute(_sql_bytes(query), params)
+                    else:
+                        cursor.execute(_sql_bytes(query))
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        yield from rows
+                finally:
+                    # Drain rows left unread by an early close so the connection is reusable
+                    connection.consume_results()
+                    cursor.close()
+            finally:
+                connection.close()
+        except Error as e:
+            log.error("Error fetching data: %s [%.200s]", e, query)
+            raise
+    
+    def get_last_insert_id(self):
+        """Get the ID generated by this thread's last execute_query"""
+        return getattr(self._local, 'last_insert_id', None)
+
+
+# Create a global database instance
+db = Database()
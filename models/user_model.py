@@ -1,49 +1,86 @@
-"""
-User Model — Pure Blueprint (MVC)
-Contains ONLY: TABLE name, FIELDS list, SQL query constants, and pure utility methods.
-Zero database imports. Zero query execution.
-"""
-
-import hashlib
-
-
-class UserModel:
-    """Data structure and SQL query holder for user accounts"""
-
-    TABLE = 'users'
-
-    FIELDS = [
-        'id', 'employee_id', 'username', 'password_hash',
-        'role', 'is_active', 'created_at', 'updated_at'
-    ]
-
-    # ── SQL Query Constants ──
-    Q_INSERT = """
-        INSERT INTO users (employee_id, username, password_hash, role, is_active)
-        VALUES (%s, %s, %s, %s, 1)
-    """
-
-    Q_AUTHENTICATE = """
-        SELECT u.*, e.full_name, e.employee_code, e.position, e.department
-        FROM users u
-        INNER JOIN employees e ON u.employee_id = e.id
-        WHERE u.username = %s AND u.password_hash = %s AND u.is_active = 1
-    """
-
-    Q_SELECT_BY_ID = "SELECT * FROM users WHERE id = %s"
-
-    Q_SELECT_BY_USERNAME = "SELECT * FROM users WHERE username = %s"
-
-    Q_SELECT_BY_EMPLOYEE_ID = "SELECT * FROM users WHERE employee_id = %s"
-
-    Q_UPDATE_PASSWORD = "UPDATE users SET password_hash = %s WHERE id = %s"
-
-    Q_DEACTIVATE = "UPDATE users SET is_active = 0 WHERE id = %s"
-
-    Q_ACTIVATE = "UPDATE users SET is_active = 1 WHERE id = %s"
-
-    # ── Pure Utility (no DB access) ──
-    @staticmethod
-    def hash_password(password):
-        """Hash password using SHA-256 (pure computation, no DB)"""
-        return hashlib.sha256(password.encode()).hexdigest()
+"""
+User Model — Pure Blueprint (MVC)
+Contains ONLY: TABLE name, FIELDS list, SQL query constants, and pure utility methods.
+Zero database imports. Zero query execution.
+"""
+
+import hmac
+import os
+from hashlib import scrypt as _scrypt, sha256 as _sha256
+
+
+class UserModel:
+    """Data structure and SQL query holder for user accounts"""
+
+    TABLE = 'users'
+
+    FIELDS = [
+        'id', 'employee_id', 'username', 'password_hash',
+        'role', 'is_active', 'created_at', 'updated_at'
+    ]
+
+    # ── SQL Query Constants ──
+    Q_INSERT = """
+        INSERT INTO users (employee_id, username, password_hash, role, is_active)
+        VALUES (%s, %s, %s, %s, 1)
+    """
+
+    # Salted hashes can't be matched in SQL; callers check the password with verify_password
+    Q_AUTHENTICATE = """
+        SELECT u.*, e.full_name, e.employee_code, e.position, e.department
+        FROM users u
+        INNER JOIN employees e ON u.employee_id = e.id
+        WHERE u.username = %s AND u.is_active = 1
+    """
+
+    Q_SELECT_BY_ID = "SELECT * FROM users WHERE id = %s"
+
+    Q_SELECT_BY_USERNAME = "SELECT * FROM users WHERE username = %s"
+
+    Q_SELECT_BY_EMPLOYEE_ID = "SELECT * FROM users WHERE employee_id = %s"
+
+    Q_UPDATE_PASSWORD = "UPDATE users SET password_hash = %s WHERE id = %s"
+
+    # Set only if the stored hash is still the one just verified (no lost concurrent change)
+    Q_CHANGE_PASSWORD = "UPDATE users SET password_hash = %s WHERE id = %s AND password_hash = %s"
+
+    Q_DEACTIVATE = "UPDATE users SET is_active = 0 WHERE id = %s"
+
+    Q_ACTIVATE = "UPDATE users SET is_active = 1 WHERE id = %s"
+
+    # scrypt cost: 16 MiB of memory and a few tens of milliseconds per hash
+    SCRYPT_N = 2 ** 14
+    SCRYPT_R = 8
+    SCRYPT_P = 1
+    SCRYPT_MAXMEM = 64 * 1024 * 1024
+
+    # ── Pure Utility (no DB access) ──
+    @staticmethod
+    def hash_password(password):
+        """Salted scrypt hash as 'scrypt$n$r$p$salt$digest' (pure computation, no DB)"""
+        n, r, p = UserModel.SCRYPT_N, UserModel.SCRYPT_R, UserModel.SCRYPT_P
+        salt = os.urandom(16)
+        digest = _scrypt(password.encode(), salt=salt, n=n, r=r, p=p,
+                         maxmem=UserModel.SCRYPT_MAXMEM, dklen=32)
+        return f"scrypt${n}${r}${p}${salt.hex()}${digest.hex()}"
+
+    @staticmethod
+    def verify_password(password_hash, password):
+        """Check a password against a stored scrypt or legacy unsalted SHA-256 hash"""
+        if not password_hash:
+            return False
+        if not password_hash.startswith('scrypt$'):
+            return hmac.compare_digest(password_hash, _sha256(password.encode()).hexdigest())
+        try:
+            _, n, r, p, salt, expected = password_hash.split('$')
+            digest = _scrypt(password.encode(), salt=bytes.fromhex(salt), n=int(n), r=int(r),
+                             p=int(p), maxmem=UserModel.SCRYPT_MAXMEM, dklen=len(expected) // 2)
+        except ValueError:
+            return False
+        return hmac.compare_digest(digest.hex(), expected)
+
+    @staticmethod
+    def needs_rehash(password_hash):
+        """True for legacy SHA-256 hashes or scrypt hashes made with older cost settings"""
+        current = f"scrypt${UserModel.SCRYPT_N}${UserModel.SCRYPT_R}${UserModel.SCRYPT_P}$"
+        return not (password_hash or '').startswith(current)
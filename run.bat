@@ -1,9 +1,9 @@
-@echo off
-echo ========================================
-echo Work Log - Employee Attendance System
-echo ========================================
-echo.
-echo Starting application...
-echo.
-python main.py
-pause
+@echo off
+echo ========================================
+echo Work Log - Employee Attendance System
+echo ========================================
+echo.
+echo Starting application...
+echo.
+python main.py
+pause
@@ -1,46 +1,49 @@
-"""Run migration to add employee_notified column - outputs to file"""
-import mysql.connector
-import sys
-
-results = []
-
-conn = mysql.connector.connect(host='localhost', user='root', password='', database='worklog_db')
-cur = conn.cursor()
-
-# Add column to leave_requests if not exists
-try:
-    cur.execute("ALTER TABLE leave_requests ADD COLUMN employee_notified TINYINT(1) DEFAULT 0")
-    conn.commit()
-    results.append("Added employee_notified to leave_requests")
-except Exception as e:
-    if "Duplicate" in str(e):
-        results.append("leave_requests already has employee_notified")
-    else:
-        results.append(f"Error leave: {e}")
-
-# Add column to overtime_requests if not exists
-try:
-    cur.execute("ALTER TABLE overtime_requests ADD COLUMN employee_notified TINYINT(1) DEFAULT 0")
-    conn.commit()
-    results.append("Added employee_notified to overtime_requests")
-except Exception as e:
-    if "Duplicate" in str(e):
-        results.append("overtime_requests already has employee_notified")
-    else:
-        results.append(f"Error ot: {e}")
-
-# Mark existing reviewed records as notified
-cur.execute("UPDATE leave_requests SET employee_notified = 1 WHERE status IN ('Approved', 'Rejected')")
-conn.commit()
-results.append(f"Updated {cur.rowcount} leave_requests")
-
-cur.execute("UPDATE overtime_requests SET employee_notified = 1 WHERE status IN ('Approved', 'Rejected')")
-conn.commit()
-results.append(f"Updated {cur.rowcount} overtime_requests")
-
-conn.close()
-results.append("Migration complete!")
-
-# Write to file
-with open("c:/worklog/migration_result.txt", "w") as f:
-    f.write("\n".join(results))
+"""Run migration to add employee_notified column - outputs to file"""
+import mysql.connector
+import sys
+
+results = []
+
+conn = mysql.connector.connect(host='localhost', user='root', password='', database='worklog_db')
+cur = conn.cursor()
+
+cur.execute("""
+    SELECT TABLE_NAME FROM INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE() AND COLUMN_NAME = 'employee_notified'
+      AND TABLE_NAME IN ('leave_requests', 'overtime_requests')
+""")
+existing = {row[0] for row in cur.fetchall()}
+
+# Add the column where missing; online DDL keeps the table readable and writable.
+# DDL commits implicitly, so each ALTER stands on its own.
+added = []
+for table in ('leave_requests', 'overtime_requests'):
+    if table in existing:
+        results.append(f"{table} already has employee_notified")
+        continue
+    try:
+        cur.execute(f"ALTER TABLE {table} ADD COLUMN employee_notified TINYINT(1) DEFAULT 0, "
+                    "ALGORITHM=INPLACE, LOCK=NONE")
+        added.append(table)
+        results.append(f"Added employee_notified to {table}")
+    except Exception as e:
+        results.append(f"Error {table}: {e}")
+
+# Mark already-reviewed records as notified, only for freshly added columns so a
+# re-run does not hide reviews employees have not seen yet. One commit for both.
+try:
+    for table in added:
+        cur.execute(f"UPDATE {table} SET employee_notified = 1 WHERE status IN ('Approved', 'Rejected')")
+        results.append(f"Updated {cur.rowcount} {table}")
+    conn.commit()
+except Exception as e:
+    conn.rollback()
+    results.append(f"Error marking reviewed records: {e}")
+
+cur.close()
+conn.close()
+results.append("Migration complete!")
+
+# Write to file
+with open("c:/worklog/migration_result.txt", "w") as f:
+    f.write("\n".join(results))
@@ -1,5 +1,5 @@
-"""
-Utils package
-"""
-
-from utils.message_box import show_info, show_warning, show_error, show_question
+"""
+Utils package
+"""
+
+from utils.message_box import show_info, show_warning, show_error, show_question
@@ -0,0 +1,64 @@
+"""
+Background Call Utility
+Runs blocking controller calls on Qt's global thread pool and hands the
+result back on the GUI thread
+"""
+
+import logging
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+log = logging.getLogger('worklog.ui')
+
+# Calls in flight, kept referenced until their result has been delivered
+_PENDING = set()
+
+
+class _Relay(QObject):
+    """Created on the GUI thread, so its queued signal runs the callback there"""
+    finished = pyqtSignal(object)
+
+
+class _Call(QRunnable):
+    def __init__(self, fn, args, relay):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.args = args
+        self.relay = relay
+
+    def run(self):
+        try:
+            outcome = (True, self.fn(*self.args))
+        except Exception:
+            log.exception("Background call %r failed", self.fn)
+            outcome = (False, None)
+        try:
+            self.relay.finished.emit(outcome)
+        except RuntimeError:
+            # The receiving widget was destroyed while the call ran
+            _PENDING.discard(self)
+
+
+def run_async(fn, *args, on_done=None):
+    """
+    Run fn(*args) on a pool thread and call on_done(result) on the GUI thread.
+
+    Each pool thread checks out its own database connection, so independent
+    loads overlap instead of queueing on the UI thread. When on_done is a
+    widget method, the result is dropped if that widget is gone by then.
+    """
+    owner = getattr(on_done, '__self__', None)
+    relay = _Relay(owner if isinstance(owner, QObject) else None)
+    call = _Call(fn, args, relay)
+
+    def deliver(outcome):
+        _PENDING.discard(call)
+        relay.deleteLater()
+        ok, result = outcome
+        if ok and on_done is not None:
+            on_done(result)
+
+    relay.finished.connect(deliver)
+    _PENDING.add(call)
+    QThreadPool.globalInstance().start(call)
@@ -0,0 +1,95 @@
+"""
+Query Result Cache Utility
+Read results keyed by statement and parameters, dropped per table on writes
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+
+# Returned by QueryCache.get on a miss, since None and [] are valid results
+MISS = object()
+
+
+class QueryCache:
+    """
+    Bounded LRU of query results tagged with the tables they read.
+
+    A write statement that mentions a cached table drops every entry tagged
+    with it. Entries also expire after `seconds`, so writes made by other
+    clients of the same database still show up.
+
+    Each write also bumps a per-table generation. A reader takes a
+    snapshot() before querying and hands it to put(), which skips the
+    result if a write to one of its tables landed while the query ran.
+    """
+
+    def __init__(self, seconds=30, maxsize=256):
+        self.seconds = seconds
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # key -> (tables, expires_at, result)
+        self._patterns = {}  # table -> word-boundary regex for spotting writes
+        self._generations = {}  # table -> count of writes seen
+        self._epoch = 0  # bumped by clear()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISS
+            if entry[1] <= time.monotonic():
+                del self._entries[key]
+                return MISS
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def snapshot(self, tables):
+        """Write generations of `tables`, taken before running the query to cache"""
+        with self._lock:
+            self._watch(tables)
+            return self._epoch, tuple(self._generations.get(table, 0) for table in tables)
+
+    def put(self, key, tables, result, snapshot=None):
+        """Cache a result, unless a write since `snapshot` may have made it stale"""
+        with self._lock:
+            if snapshot is not None and snapshot != (
+                    self._epoch, tuple(self._generations.get(table, 0) for table in tables)):
+                return
+            self._watch(tables)
+            self._entries[key] = (frozenset(tables), time.monotonic() + self.seconds, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *tables):
+        """Drop every entry that read from any of the given tables"""
+        with self._lock:
+            self._drop(set(tables))
+
+    def invalidate_statement(self, sql):
+        """Drop entries for every cached table a write statement mentions"""
+        with self._lock:
+            if not self._patterns:
+                return
+            tables = {table for table, pattern in self._patterns.items() if pattern.search(sql)}
+            if tables:
+                self._drop(tables)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._epoch += 1
+
+    def _watch(self, tables):
+        for table in tables:
+            if table not in self._patterns:
+                self._patterns[table] = re.compile(rf'\b{re.escape(table)}\b', re.IGNORECASE)
+
+    def _drop(self, tables):
+        for table in tables:
+            self._generations[table] = self._generations.get(table, 0) + 1
+        stale = [key for key, (tagged, _, _) in self._entries.items() if not tagged.isdisjoint(tables)]
+        for key in stale:
+            del self._entries[key]
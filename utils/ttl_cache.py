@@ -0,0 +1,29 @@
+"""
+TTL Cache Utility
+Time-bucketed memoization for read-heavy controller lookups
+"""
+
+import functools
+import time
+
+
+def ttl_cache(seconds=30, maxsize=128):
+    """
+    Memoize a function for up to `seconds` seconds.
+
+    Entries are keyed on (monotonic time bucket, args), so a cached value is
+    served until the clock moves into the next bucket. The wrapped function
+    exposes cache_clear() so write paths can invalidate immediately.
+    """
+    def decorator(func):
+        @functools.lru_cache(maxsize=maxsize)
+        def cached(bucket, *args, **kwargs):
+            return func(*args, **kwargs)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return cached(int(time.monotonic() // seconds), *args, **kwargs)
+
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorator
@@ -1,13 +1,13 @@
-"""
-Views Package
-PyQt6 user interface components for Work Log application
-"""
-
-from .login_view import LoginView
-from .admin_dashboard_view import AdminDashboardView
-from .employee_dashboard_view import EmployeeDashboardView
-
-__all__ = [
-    'LoginView', 'AdminDashboardView',
-    'EmployeeDashboardView',
-]
+"""
+Views Package
+PyQt6 user interface components for Work Log application
+"""
+
+from .login_view import LoginView
+from .admin_dashboard_view import AdminDashboardView
+from .employee_dashboard_view import EmployeeDashboardView
+
+__all__ = [
+    'LoginView', 'AdminDashboardView',
+    'EmployeeDashboardView',
+]